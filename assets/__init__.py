@@ -1,5 +1,18 @@
 """Assets package for Excel Chart Generator."""
 
-from .themes import THEMES, get_theme
-
 __all__ = ['THEMES', 'get_theme']
+
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): importing the package stays free; the
+    # themes module is only executed when one of these is first touched.
+    if name in __all__:
+        from . import themes
+        obj = getattr(themes, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,136 +1,126 @@
-"""Professional style presets for charts."""
+"""Professional style presets for charts.
 
-from typing import Dict, Any
+Presets are thin projections of the canonical entries in
+:mod:`assets.comprehensive_styles`, so the style data lives in one place.
+"""
 
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
-STYLE_PRESETS = {
+from .comprehensive_styles import COMPREHENSIVE_STYLES, GridType
+
+
+# Preset names, in menu order. Each is a restricted view of the matching
+# comprehensive style rather than a second literal copy of the same data.
+_PRESET_NAMES = (
+    'Professional Clean',
+    'Analytical Grid',
+    'IMF Official',
+    'World Bank Report',
+    'Minimal Grid',
+    'Full Grid',
+    'Academic Journal',
+    'Presentation',
+    'No Grid',
+)
+
+_PRESET_KEYS = (
+    'description',
+    'background_color',
+    'grid_color',
+    'font_family',
+    'font_size',
+    'title_fontsize',
+    'grid_type',
+    'legend_position',
+)
+
+# Fields where the presets have always diverged from the comprehensive
+# styles: every preset kept its own (shorter) description, and Analytical
+# Grid its larger title. Applied on top of the projection so the derived
+# presets reproduce the historical values exactly.
+_PRESET_OVERRIDES = {
     'Professional Clean': {
-        'description': 'Professional style with horizontal grid lines (X-axis)',
-        'background_color': '#FFFFFF',
-        'grid_color': '#D0D0D0',
-        'font_family': 'Arial',
-        'font_size': 11,
-        'title_fontsize': 18,
-        'grid_type': 'x_only',
-        'show_grid': True,
-        'legend_position': 'upper right',
-    },
+        'description': 'Professional style with horizontal grid lines (X-axis)'},
     'Analytical Grid': {
         'description': 'Analytical style with vertical grid lines (Y-axis)',
-        'background_color': '#FFFFFF',
-        'grid_color': '#D5D5D5',
-        'font_family': 'Arial',
-        'font_size': 11,
-        'title_fontsize': 18,
-        'grid_type': 'y_only',
-        'show_grid': True,
-        'legend_position': 'best',
-    },
+        'title_fontsize': 18},
     'IMF Official': {
-        'description': 'IMF-style professional presentation',
-        'background_color': '#FFFFFF',
-        'grid_color': '#D5D5D5',
-        'font_family': 'Arial',
-        'font_size': 11,
-        'title_fontsize': 20,
-        'grid_type': 'x_only',
-        'show_grid': True,
-        'legend_position': 'best',
-    },
+        'description': 'IMF-style professional presentation'},
     'World Bank Report': {
-        'description': 'World Bank publication style',
-        'background_color': '#FAFAFA',
-        'grid_color': '#D0D0D0',
-        'font_family': 'Garamond',
-        'font_size': 10,
-        'title_fontsize': 18,
-        'grid_type': 'x_only',
-        'show_grid': True,
-        'legend_position': 'lower right',
-    },
+        'description': 'World Bank publication style'},
     'Minimal Grid': {
-        'description': 'Minimal design with very light grid',
-        'background_color': '#FFFFFF',
-        'grid_color': '#E8E8E8',
-        'font_family': 'Helvetica',
-        'font_size': 10,
-        'title_fontsize': 16,
-        'grid_type': 'x_only',
-        'show_grid': True,
-        'legend_position': 'best',
-    },
+        'description': 'Minimal design with very light grid'},
     'Full Grid': {
-        'description': 'Both X and Y axis gridlines',
-        'background_color': '#FFFFFF',
-        'grid_color': '#CCCCCC',
-        'font_family': 'Arial',
-        'font_size': 11,
-        'title_fontsize': 16,
-        'grid_type': 'both',
-        'show_grid': True,
-        'legend_position': 'best',
-    },
+        'description': 'Both X and Y axis gridlines'},
     'Academic Journal': {
-        'description': 'Style for academic publications',
-        'background_color': '#FFFFFF',
-        'grid_color': '#E0E0E0',
-        'font_family': 'Times New Roman',
-        'font_size': 10,
-        'title_fontsize': 14,
-        'grid_type': 'y_only',
-        'show_grid': True,
-        'legend_position': 'best',
-    },
+        'description': 'Style for academic publications'},
     'Presentation': {
-        'description': 'Clean presentation style',
-        'background_color': '#FAFAFA',
-        'grid_color': '#E0E0E0',
-        'font_family': 'Arial',
-        'font_size': 12,
-        'title_fontsize': 22,
-        'grid_type': 'x_only',
-        'show_grid': True,
-        'legend_position': 'upper right',
-    },
+        'description': 'Clean presentation style'},
     'No Grid': {
-        'description': 'Clean style without grid',
-        'background_color': '#FFFFFF',
-        'grid_color': '#FFFFFF',
-        'font_family': 'Arial',
-        'font_size': 11,
-        'title_fontsize': 16,
-        'grid_type': 'none',
-        'show_grid': False,
-        'legend_position': 'best',
-    },
+        'description': 'Clean style without grid'},
 }
 
+STYLE_PRESETS = {
+    name: MappingProxyType(
+        {key: getattr(COMPREHENSIVE_STYLES[name], key) for key in _PRESET_KEYS}
+        | {
+            # Presets keep the string form of grid_type for serialization.
+            'grid_type': COMPREHENSIVE_STYLES[name].grid_type.as_str,
+            'show_grid': COMPREHENSIVE_STYLES[name].grid_type is not GridType.NONE,
+        }
+        | _PRESET_OVERRIDES.get(name, {})
+    )
+    for name in _PRESET_NAMES
+}
 
-def get_preset(preset_name: str) -> Dict[str, Any]:
+# Entries are already read-only views; keep the alias used by get_preset.
+_FROZEN_PRESETS = STYLE_PRESETS
+
+# Error messages list every preset; join once instead of on each failed lookup.
+_PRESET_NAMES_JOINED = ', '.join(_PRESET_NAMES)
+
+
+def get_preset(preset_name: str) -> Mapping[str, Any]:
     """
     Get a style preset by name.
-    
+
+    Args:
+        preset_name: Name of the preset
+
+    Returns:
+        Read-only preset mapping
+
+    Raises:
+        ValueError: If preset doesn't exist
+    """
+    try:
+        return _FROZEN_PRESETS[preset_name]
+    except KeyError:
+        raise ValueError(f"Preset '{preset_name}' not found. Available presets: {_PRESET_NAMES_JOINED}") from None
+
+
+def get_preset_mutable(preset_name: str) -> Dict[str, Any]:
+    """
+    Get a mutable copy of a style preset by name.
+
     Args:
         preset_name: Name of the preset
-        
+
     Returns:
-        Preset dictionary
-        
+        Preset dictionary safe for caller-side mutation
+
     Raises:
         ValueError: If preset doesn't exist
     """
-    if preset_name not in STYLE_PRESETS:
-        available = ', '.join(STYLE_PRESETS.keys())
-        raise ValueError(f"Preset '{preset_name}' not found. Available presets: {available}")
-    
-    return STYLE_PRESETS[preset_name].copy()
+    return dict(get_preset(preset_name))
 
 
-def get_preset_names() -> list:
+def get_preset_names() -> tuple:
     """
-    Get list of available preset names.
-    
+    Get the available preset names.
+
     Returns:
-        List of preset names
+        Shared immutable tuple of preset names (no per-call allocation)
     """
-    return list(STYLE_PRESETS.keys())
+    return _PRESET_NAMES
@@ -1,10 +1,21 @@
-"""Predefined color themes for charts with typography."""
+"""Predefined color themes for charts with typography.
 
-from typing import Dict, Any
+Theme definitions live in small per-theme factory functions and are only
+materialized (interned + frozen) the first time they are requested, so
+importing this module does almost no work. ``THEMES`` is still available
+as a module attribute for back-compat and is assembled lazily via PEP 562.
+"""
 
+from __future__ import annotations
 
-THEMES = {
-    'Light': {
+import sys
+from dataclasses import dataclass, fields as _dc_fields
+from enum import Enum
+from types import MappingProxyType
+
+
+def _mk_light() -> dict[str, object]:
+    return {
         'background': '#FFFFFF',
         'grid': '#CCCCCC',
         'text': '#000000',
@@ -25,8 +36,11 @@ THEMES = {
             '#bcbd22',  # Olive
             '#17becf',  # Cyan
         ]
-    },
-    'Dark': {
+    }
+
+
+def _mk_dark() -> dict[str, object]:
+    return {
         'background': '#1E1E1E',
         'grid': '#404040',
         'text': '#FFFFFF',
@@ -47,8 +61,11 @@ THEMES = {
             '#66D9EF',  # Bright Cyan
             '#FFB84D',  # Bright Amber
         ]
-    },
-    'IMF Professional': {
+    }
+
+
+def _mk_imf_professional() -> dict[str, object]:
+    return {
         'background': '#FFFFFF',
         'grid': '#E5E5E5',
         'text': '#1A1A1A',
@@ -69,8 +86,11 @@ THEMES = {
             '#1976D2',  # IMF Bright Blue
             '#00BCD4',  # IMF Light Cyan
         ]
-    },
-    'IMF Report': {
+    }
+
+
+def _mk_imf_report() -> dict[str, object]:
+    return {
         'background': '#FAFAFA',
         'grid': '#D0D0D0',
         'text': '#1A1A1A',
@@ -85,8 +105,11 @@ THEMES = {
             '#388E3C',  # Report Green
             '#F57C00',  # Report Orange
         ]
-    },
-    'World Bank Official': {
+    }
+
+
+def _mk_world_bank_official() -> dict[str, object]:
+    return {
         'background': '#FFFFFF',
         'grid': '#E0E0E0',
         'text': '#212121',
@@ -107,8 +130,11 @@ THEMES = {
             '#1976D2',  # World Bank Sky Blue
             '#C62828',  # World Bank Dark Red
         ]
-    },
-    'World Bank Elegant': {
+    }
+
+
+def _mk_world_bank_elegant() -> dict[str, object]:
+    return {
         'background': '#F5F5F5',
         'grid': '#BDBDBD',
         'text': '#1A1A1A',
@@ -124,9 +150,11 @@ THEMES = {
             '#00897B',  # Teal
             '#F57F17',  # Amber
         ]
-    },
+    }
+
 
-    'Publication': {
+def _mk_publication() -> dict[str, object]:
+    return {
         'background': '#FFFFFF',
         'grid': '#DDDDDD',
         'text': '#000000',
@@ -147,8 +175,11 @@ THEMES = {
             '#666666',  # Dark Gray
             '#333333',  # Very Dark Gray
         ]
-    },
-    'Accessible (Colorblind Safe)': {
+    }
+
+
+def _mk_accessible() -> dict[str, object]:
+    return {
         'background': '#FFFFFF',
         'grid': '#D0D0D0',
         'text': '#000000',
@@ -167,38 +198,302 @@ THEMES = {
             '#CC79A7',  # Reddish Purple
             '#000000',  # Black
         ]
-    },
+    }
+
+
+_THEME_FACTORIES = {
+    sys.intern('Light'): _mk_light,
+    sys.intern('Dark'): _mk_dark,
+    sys.intern('IMF Professional'): _mk_imf_professional,
+    sys.intern('IMF Report'): _mk_imf_report,
+    sys.intern('World Bank Official'): _mk_world_bank_official,
+    sys.intern('World Bank Elegant'): _mk_world_bank_elegant,
+    sys.intern('Publication'): _mk_publication,
+    sys.intern('Accessible (Colorblind Safe)'): _mk_accessible,
 }
 
 
-def get_theme(theme_name: str) -> Dict[str, Any]:
+# Error messages list every name; join once at import instead of on each
+# failed lookup.
+_THEME_NAMES_JOINED = ', '.join(_THEME_FACTORIES)
+
+_THEME_NAMES = tuple(_THEME_FACTORIES)
+_THEME_INDEX = {name: i for i, name in enumerate(_THEME_NAMES)}
+_FACTORIES = tuple(_THEME_FACTORIES.values())
+
+
+# Enum alternative to raw name strings, generated from the factory registry.
+# get_theme takes members directly and resolves them by position instead of
+# hashing the name, which matters in per-series loops; each member also
+# compares/serializes as its plain string value (str subclass).
+ThemeName = Enum(
+    'ThemeName',
+    {
+        name.upper().replace(' ', '_').replace('(', '').replace(')', ''): name
+        for name in _THEME_FACTORIES
+    },
+    type=str,
+    module=__name__,
+)
+for _i, _member in enumerate(ThemeName):
+    _member._index = _i
+del _i, _member
+
+
+# Specialized name dispatcher generated once for the closed name set: one
+# identity compare per theme against the interned canonical string, with the
+# index dict as the fallback for non-interned inputs. When the caller's
+# string is the canonical object (names from get_theme_names, the factory
+# registry, or interned literals) the branch chain skips hashing entirely.
+_ns = {'_fallback': _THEME_INDEX.get}
+_src = ['def _name_to_index(name):']
+for _i, _name in enumerate(_THEME_NAMES):
+    _ns['_N%d' % _i] = _name
+    _src.append('    if name is _N%d: return %d' % (_i, _i))
+_src.append('    return _fallback(name)')
+exec(compile('\n'.join(_src), '<themes-dispatch>', 'exec'), _ns)
+_name_to_index = _ns['_name_to_index']
+del _ns, _src, _i, _name
+
+
+def _intern_theme(theme: dict[str, object]) -> dict[str, object]:
+    """Intern keys and repeated string values so dict lookups are pointer
+    compares and duplicated literals share storage. Palette entries are
+    interned too: hex codes like '#D32F2F' or '#003478' recur across
+    themes, so each distinct color string is stored once process-wide."""
+    for key in list(theme):
+        value = theme.pop(key)
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif isinstance(value, list):
+            value = [sys.intern(item) if isinstance(item, str) else item for item in value]
+        theme[sys.intern(key)] = value
+    return theme
+
+
+@dataclass(frozen=True, slots=True)
+class Theme:
+    """A rendered-out theme record: slotted fields instead of a dict, so
+    field reads are C-level slot access and the per-theme footprint is a
+    fixed struct rather than a hash table. Subscripting still works for
+    callers written against the old dict form."""
+
+    background: str
+    grid: str
+    text: str
+    axis: str
+    font_family: str
+    font_size: int
+    title_fontsize: int
+    title_fontweight: str
+    line_colors: tuple[str, ...]
+    # Rec. 709 luma of the background, parsed from hex once at materialization
+    # so contrast decisions never re-parse the color string.
+    background_luminance: float = 0.0
+
+    def __post_init__(self):
+        bg = self.background
+        object.__setattr__(
+            self,
+            'background_luminance',
+            0.2126 * int(bg[1:3], 16) + 0.7152 * int(bg[3:5], 16) + 0.0722 * int(bg[5:7], 16),
+        )
+
+    @property
+    def is_dark(self) -> bool:
+        """Whether the background is dark enough to need light foregrounds."""
+        return self.background_luminance < 128.0
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def as_dict(self) -> dict[str, object]:
+        """Plain-dict form (line_colors stays a tuple)."""
+        return {f.name: getattr(self, f.name) for f in _dc_fields(self)}
+
+
+# Frozen per-theme records, materialized on first request. get_theme used to
+# .copy() the top dict on every call while still sharing the mutable
+# line_colors list; the shared frozen records avoid the per-call allocation
+# and close that mutability hole (line_colors become tuples).
+_FROZEN_BY_INDEX = [None] * len(_THEME_FACTORIES)
+
+
+def get_theme(theme_name) -> Theme:
     """
     Get a theme by name.
-    
+
+    Args:
+        theme_name: Name of the theme (str or ThemeName member)
+
+    Returns:
+        Shared immutable Theme record
+
+    Raises:
+        ValueError: If theme doesn't exist
+    """
+    if type(theme_name) is ThemeName:
+        idx = theme_name._index
+    else:
+        idx = _name_to_index(theme_name)
+        if idx is None:
+            raise ValueError(
+                f"Theme '{theme_name}' not found. Available themes: {_THEME_NAMES_JOINED}"
+            )
+    frozen = _FROZEN_BY_INDEX[idx]
+    if frozen is not None:
+        return frozen
+    raw = _intern_theme(_FACTORIES[idx]())
+    frozen = Theme(**{**raw, 'line_colors': tuple(raw['line_colors'])})
+    _FROZEN_BY_INDEX[idx] = frozen
+    return frozen
+
+
+def __getattr__(name):
+    # Back-compat: THEMES used to be an eager module-level dict of dicts.
+    # Assemble it from the factories only if something actually asks for it.
+    if name == 'THEMES':
+        themes = {n: _intern_theme(factory()) for n, factory in _THEME_FACTORIES.items()}
+        globals()['THEMES'] = themes
+        return themes
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Per-theme float32 RGBA palettes, hex-parsed once per process instead of on
+# every draw (matplotlib's to_rgba does regex + int() per string). Built on
+# first request so importing this module stays numpy-free.
+_RGBA_CACHE: dict = {}
+
+
+def get_line_colors_rgba(theme_name: str):
+    """
+    Get a theme's line colors as a float32 [N, 4] RGBA array in 0..1.
+
+    The array is parsed from the hex palette once and cached; matplotlib
+    accepts the rows directly wherever a color is expected.
+
+    Args:
+        theme_name: Name of the theme
+
+    Returns:
+        Read-only numpy float32 array of shape (N, 4)
+
+    Raises:
+        ValueError: If theme doesn't exist
+    """
+    try:
+        return _RGBA_CACHE[theme_name]
+    except KeyError:
+        pass
+
+    colors = get_theme(theme_name)['line_colors']
+
+    import numpy as np
+
+    rgba = np.ones((len(colors), 4), dtype=np.float32)
+    for i, hex_color in enumerate(colors):
+        rgba[i, :3] = (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16))
+    rgba[:, :3] /= 255.0
+    rgba.setflags(write=False)
+    _RGBA_CACHE[theme_name] = rgba
+    return rgba
+
+
+# All palettes packed into one contiguous uint8 table of shape
+# (num_themes, max_colors, 3) plus a length vector: 3 bytes per color instead
+# of a ~50-byte Python string, and contiguous iteration for vectorized
+# consumers. Built on first request, like the RGBA cache above.
+_RGB_PACKED = None
+
+
+def _pack_colors():
+    global _RGB_PACKED
+
+    import numpy as np
+
+    palettes = [get_theme(name)['line_colors'] for name in _THEME_NAMES]
+    lens = np.array([len(p) for p in palettes], dtype=np.intp)
+    packed = np.zeros((len(palettes), int(lens.max()), 3), dtype=np.uint8)
+    for ti, palette in enumerate(palettes):
+        for ci, hex_color in enumerate(palette):
+            packed[ti, ci] = (int(hex_color[1:3], 16), int(hex_color[3:5], 16), int(hex_color[5:7], 16))
+    packed.setflags(write=False)
+    _RGB_PACKED = (packed, lens)
+    return _RGB_PACKED
+
+
+def get_line_colors_rgb(theme_name: str):
+    """
+    Get a theme's line colors as a uint8 [N, 3] RGB view in 0..255.
+
+    The rows are a zero-copy slice of the shared packed palette table; the
+    hex strings remain available via ``get_theme(...)['line_colors']``.
+
+    Args:
+        theme_name: Name of the theme
+
+    Returns:
+        Read-only numpy uint8 array of shape (N, 3)
+
+    Raises:
+        ValueError: If theme doesn't exist
+    """
+    packed = _RGB_PACKED or _pack_colors()
+    try:
+        idx = _THEME_INDEX[theme_name]
+    except KeyError:
+        raise ValueError(
+            f"Theme '{theme_name}' not found. Available themes: {_THEME_NAMES_JOINED}"
+        ) from None
+    table, lens = packed
+    return table[idx, :lens[idx]]
+
+
+def is_dark_theme(theme_name) -> bool:
+    """
+    Whether a theme's background is dark (precomputed luminance < 128).
+
+    Args:
+        theme_name: Name of the theme (str or ThemeName member)
+
+    Returns:
+        True if the theme needs light foreground colors
+
+    Raises:
+        ValueError: If theme doesn't exist
+    """
+    return get_theme(theme_name).is_dark
+
+
+def get_theme_mutable(theme_name: str) -> dict[str, object]:
+    """
+    Get a mutable copy of a theme by name.
+
     Args:
         theme_name: Name of the theme
-        
+
     Returns:
-        Theme dictionary
-        
+        Theme dictionary safe for caller-side mutation
+
     Raises:
         ValueError: If theme doesn't exist
     """
-    if theme_name not in THEMES:
-        available = ', '.join(THEMES.keys())
-        raise ValueError(f"Theme '{theme_name}' not found. Available themes: {available}")
-    
-    return THEMES[theme_name].copy()
+    theme = get_theme(theme_name).as_dict()
+    theme['line_colors'] = list(theme['line_colors'])
+    return theme
 
 
-def get_theme_names() -> list:
+def get_theme_names() -> tuple:
     """
-    Get list of available theme names.
-    
+    Get the available theme names.
+
     Returns:
-        List of theme names
+        Shared immutable tuple of theme names (no per-call allocation)
     """
-    return list(THEMES.keys())
+    return _THEME_NAMES
 
 
 SPECIAL_PRESETS = {
@@ -257,14 +552,92 @@ SPECIAL_PRESETS = {
 }
 
 
-def get_special_preset(preset_name: str) -> Dict[str, Any]:
-    """Get a special scenario preset."""
-    if preset_name not in SPECIAL_PRESETS:
-        available = ', '.join(SPECIAL_PRESETS.keys())
-        raise ValueError(f"Preset '{preset_name}' not found. Available: {available}")
-    return SPECIAL_PRESETS[preset_name].copy()
+# Frozen like the themes above; the per-highlight dicts are wrapped too so
+# the whole preset is read-only.
+_FROZEN_SPECIAL_PRESETS = {
+    name: MappingProxyType({
+        **preset,
+        'period_highlights': tuple(
+            MappingProxyType(dict(highlight)) for highlight in preset['period_highlights']
+        ),
+    })
+    for name, preset in SPECIAL_PRESETS.items()
+}
+
+
+def get_special_preset(preset_name: str) -> MappingProxyType:
+    """Get a special scenario preset (read-only)."""
+    try:
+        return _FROZEN_SPECIAL_PRESETS[preset_name]
+    except KeyError:
+        raise ValueError(
+            f"Preset '{preset_name}' not found. Available: {_SPECIAL_PRESET_NAMES_JOINED}"
+        ) from None
+
+
+# Structured-array form of the highlight spans for vectorized drawing:
+# one contiguous record per span instead of a dict of boxed values. Built
+# lazily, same as the palette tables above, so numpy stays off the import
+# path.
+_PACKED_SPAN_CACHE: dict = {}
+
+
+def get_special_preset_packed(preset_name: str):
+    """
+    Get a preset's period highlights as a numpy structured array.
+
+    Fields are ``start`` (i4), ``end`` (i4), ``alpha`` (f4) and ``rgb``
+    (u1[3]); the drawing layer can iterate rows without per-span dict
+    lookups, e.g. ``ax.axvspan(row['start'], row['end'],
+    color=row['rgb'] / 255.0, alpha=row['alpha'])``.
+
+    Args:
+        preset_name: Name of the preset
+
+    Returns:
+        Read-only structured array, one record per highlight span
+
+    Raises:
+        ValueError: If preset doesn't exist
+    """
+    try:
+        return _PACKED_SPAN_CACHE[preset_name]
+    except KeyError:
+        pass
+
+    highlights = get_special_preset(preset_name)['period_highlights']
+
+    import numpy as np
+
+    span_dtype = np.dtype([('start', 'i4'), ('end', 'i4'), ('alpha', 'f4'), ('rgb', 'u1', 3)])
+    spans = np.array(
+        [
+            (
+                h['start'],
+                h['end'],
+                h['alpha'],
+                (int(h['color'][1:3], 16), int(h['color'][3:5], 16), int(h['color'][5:7], 16)),
+            )
+            for h in highlights
+        ],
+        dtype=span_dtype,
+    )
+    spans.setflags(write=False)
+    _PACKED_SPAN_CACHE[preset_name] = spans
+    return spans
+
+
+def get_special_preset_mutable(preset_name: str) -> dict[str, object]:
+    """Get a mutable copy of a special scenario preset."""
+    preset = dict(get_special_preset(preset_name))
+    preset['period_highlights'] = [dict(h) for h in preset['period_highlights']]
+    return preset
+
+
+_SPECIAL_PRESET_NAMES = tuple(SPECIAL_PRESETS.keys())
+_SPECIAL_PRESET_NAMES_JOINED = ', '.join(_SPECIAL_PRESET_NAMES)
 
 
-def get_preset_names() -> list:
-    """Get list of available special presets."""
-    return list(SPECIAL_PRESETS.keys())
+def get_preset_names() -> tuple:
+    """Get the available special preset names (shared immutable tuple)."""
+    return _SPECIAL_PRESET_NAMES
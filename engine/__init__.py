@@ -1,6 +1,25 @@
 """Chart engine package for Excel Chart Generator."""
 
-from .chart_engine import ChartEngine
-from .config_builder import ChartConfig
+_LAZY = {
+    'ChartEngine': ('.chart_engine', 'ChartEngine'),
+    'ChartConfig': ('.config_builder', 'ChartConfig'),
+}
 
-__all__ = ['ChartEngine', 'ChartConfig']
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    # Lazy re-exports (PEP 562): chart_engine pulls in matplotlib, so merely
+    # importing this package should stay free until a class is first used.
+    if name in _LAZY:
+        from importlib import import_module
+
+        module_name, attr = _LAZY[name]
+        obj = getattr(import_module(module_name, __name__), attr)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
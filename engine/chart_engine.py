@@ -1,26 +1,121 @@
 """Matplotlib-based chart rendering engine."""
 
+from __future__ import annotations
+
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_agg import FigureCanvasAgg
-from matplotlib import ticker
-from matplotlib import font_manager as fm
-import pandas as pd
+import numpy as np
+from dataclasses import replace
+from functools import lru_cache
 from typing import Dict, Optional
 from pathlib import Path
 
 from .config_builder import ChartConfig
 
+# pandas, font_manager and ticker are imported inside the methods that use
+# them: pandas is an independent ~300ms cold import that smoothing and
+# grouped axes may never need, and deferring the matplotlib submodules keeps
+# this module's import cost at Figure + Agg only.
+
+
+# Shared formatter instance: FormatStrFormatter is stateless in __call__
+# (it never touches its attached axis), so one can serve every axis instead
+# of being reallocated per _configure_axis call. PercentFormatter and the
+# locators are NOT shared — they read self.axis.get_view_interval() when
+# formatting/ticking, and set_major_formatter rebinds .axis on attach, so a
+# shared instance on two live axes would work against the wrong one.
+_DECIMAL_FMT = None
+
+
+@lru_cache(maxsize=32)
+def _resolve_font(requested_family: str) -> str:
+    """
+    Resolve a requested font family to one that is actually installed.
+
+    findfont walks the font cache and can probe a 5-font fallback list, so
+    the result is memoized per family; repeat renders skip the probe (and
+    the not-installed warning fires once per family, not once per chart).
+
+    Args:
+        requested_family: Font family from the chart config
+
+    Returns:
+        The requested family if available, otherwise the first available
+        fallback
+    """
+    from matplotlib import font_manager as fm
+
+    try:
+        fm.findfont(requested_family, fallback_to_default=False)
+        return requested_family
+    except Exception:
+        pass
+
+    # Font not found, try fallbacks
+    resolved_family = requested_family
+    for fb in ['Segoe UI', 'Arial', 'Calibri', 'DejaVu Sans', 'sans-serif']:
+        try:
+            fm.findfont(fb, fallback_to_default=False)
+            resolved_family = fb
+            break
+        except Exception:
+            continue
+
+    # Show warning if requested font is not available
+    if requested_family not in ['sans-serif', 'serif', 'monospace']:
+        import warnings
+        font_download_links = {
+            'Arial': 'https://www.cufonfonts.com/font/arial',
+            'Calibri': 'https://www.fontmirror.com/calibri',
+            'Garamond': 'https://fonts.google.com/?query=garamond',
+            'Georgia': 'https://www.cufonfonts.com/font/georgia',
+            'Times New Roman': 'https://www.cufonfonts.com/font/times-new-roman',
+            'Helvetica': 'https://www.cufonfonts.com/font/helvetica',
+            'Palatino Linotype': 'https://www.cufonfonts.com/font/palatino-linotype',
+            'Roboto': 'https://fonts.google.com/specimen/Roboto',
+            'Open Sans': 'https://fonts.google.com/specimen/Open+Sans',
+        }
+
+        download_link = font_download_links.get(requested_family, 'https://fonts.google.com/')
+
+        warning_msg = (
+            f"\n⚠️ Font '{requested_family}' is not installed on your system.\n"
+            f"Using fallback font: '{resolved_family}'\n"
+            f"\nTo install '{requested_family}':\n"
+            f"  Download: {download_link}\n"
+            f"  Or search Google Fonts: https://fonts.google.com/\n"
+        )
+        warnings.warn(warning_msg, UserWarning)
+        print(warning_msg)  # Also print to console for visibility
+
+    return resolved_family
+
 
 class ChartEngine:
     """Handles chart generation using matplotlib."""
     
-    def __init__(self):
-        """Initialize the chart engine."""
+    def __init__(self, reuse_figure: bool = True):
+        """
+        Initialize the chart engine.
+
+        Args:
+            reuse_figure: Keep the Figure and its axes alive between
+                create_chart calls, clearing them instead of rebuilding.
+                Figure construction (spines, tick machinery) dominates
+                small-chart rendering, so reuse is the default.
+        """
         self.figure: Optional[Figure] = None
         self.config: Optional[ChartConfig] = None
+        self._reuse_figure = reuse_figure
+        self._ax1 = None
+        self._ax2 = None
+        self._resolved_family = None
+        # Live artists from the last render, for the recolor fast path.
+        self._last_data: Optional[Dict] = None
+        self._line_artists: Dict[str, object] = {}
+        self._legend_proxies = []
         
     def create_chart(self, data: Dict[str, pd.Series], config: ChartConfig) -> Figure:
         """
@@ -44,106 +139,76 @@ class ChartEngine:
         if not config.lines:
             raise ValueError("No lines configured")
         
+        # Color-only tweaks (the most common picker interaction) are
+        # applied to the live Line2D artists instead of replotting, which
+        # skips axes clearing, locator setup and data transforms entirely.
+        if (self._reuse_figure and self.figure is not None
+                and data is self._last_data
+                and self._apply_line_colors(config)):
+            self.config = config
+            return self.figure
+
         # Store configuration
         self.config = config
-        
-        # Close any existing figures to prevent memory leaks
-        plt.close('all')
-        
-        # Create figure and primary axis
-        self.figure = plt.figure(
-            figsize=(config.figure_width, config.figure_height),
-            dpi=config.dpi,
-            facecolor=config.background_color
-        )
-        
-        ax1 = self.figure.add_subplot(111)
+        self._last_data = data
+        self._line_artists = {}
+        self._legend_proxies = []
+
+        if self._reuse_figure and self.figure is not None:
+            # Reuse the live figure: clearing the axes keeps the allocated
+            # tick/spine/text machinery instead of rebuilding it per chart.
+            if self._ax2 is not None:
+                self._ax2.remove()
+                self._ax2 = None
+            ax1 = self._ax1
+            ax1.cla()
+            for txt in list(self.figure.texts):  # stale subtitles
+                txt.remove()
+            self.figure.set_size_inches(config.figure_width, config.figure_height)
+            self.figure.set_dpi(config.dpi)
+            self.figure.set_facecolor(config.background_color)
+        else:
+            # Create a bare Agg figure directly: no pyplot figure registry,
+            # no gcf bookkeeping, and nothing to leak or close globally.
+            self.figure = Figure(
+                figsize=(config.figure_width, config.figure_height),
+                dpi=config.dpi,
+                facecolor=config.background_color
+            )
+            FigureCanvasAgg(self.figure)  # attaches itself for draw/save
+            ax1 = self._ax1 = self.figure.add_subplot(111)
+
         ax1.set_facecolor(config.background_color)
+
+        # tight_layout() runs a renderer-driven bbox solve (it renders text
+        # twice) on every chart; the constrained layout engine reaches the
+        # same margins incrementally during the normal draw, so use it to
+        # honor the config's tight_layout flag instead of an extra pass.
+        self.figure.set_layout_engine('constrained' if config.tight_layout else 'none')
+
+        # Resolve the font once (memoized); fonts are applied per artist
+        # below instead of mutating the global rcParams per chart.
+        resolved_family = self._resolved_family = _resolve_font(config.font_family)
+
+        # Hoist optional config fields into locals: one getattr each instead
+        # of a probe (plus default construction) at every use site below.
+        text_color = getattr(config, 'text_color', '#000000')
+        title_text_color = getattr(config, 'text_color', config.y_axis.color)
+        subtitle = getattr(config, 'subtitle', '')
+        subtitle_fontsize = getattr(config, 'subtitle_fontsize', 12)
+        subtitle_fontweight = getattr(config, 'subtitle_fontweight', 'normal')
         
-        # Set font and text properties (with robust fallback)
-        requested_family = config.font_family
-        resolved_family = requested_family
-        font_available = False
-        
-        try:
-            fm.findfont(requested_family, fallback_to_default=False)
-            font_available = True
-        except Exception:
-            # Font not found, try fallbacks
-            fallback_fonts = ['Segoe UI', 'Arial', 'Calibri', 'DejaVu Sans', 'sans-serif']
-            for fb in fallback_fonts:
-                try:
-                    fm.findfont(fb, fallback_to_default=False)
-                    resolved_family = fb
-                    break
-                except Exception:
-                    continue
-            
-            # Show warning if requested font is not available
-            if not font_available and requested_family not in ['sans-serif', 'serif', 'monospace']:
-                import warnings
-                font_download_links = {
-                    'Arial': 'https://www.cufonfonts.com/font/arial',
-                    'Calibri': 'https://www.fontmirror.com/calibri',
-                    'Garamond': 'https://fonts.google.com/?query=garamond',
-                    'Georgia': 'https://www.cufonfonts.com/font/georgia',
-                    'Times New Roman': 'https://www.cufonfonts.com/font/times-new-roman',
-                    'Helvetica': 'https://www.cufonfonts.com/font/helvetica',
-                    'Palatino Linotype': 'https://www.cufonfonts.com/font/palatino-linotype',
-                    'Roboto': 'https://fonts.google.com/specimen/Roboto',
-                    'Open Sans': 'https://fonts.google.com/specimen/Open+Sans',
-                }
-                
-                download_link = font_download_links.get(requested_family, 'https://fonts.google.com/')
-                
-                warning_msg = (
-                    f"\n⚠️ Font '{requested_family}' is not installed on your system.\n"
-                    f"Using fallback font: '{resolved_family}'\n"
-                    f"\nTo install '{requested_family}':\n"
-                    f"  Download: {download_link}\n"
-                    f"  Or search Google Fonts: https://fonts.google.com/\n"
-                )
-                warnings.warn(warning_msg, UserWarning)
-                print(warning_msg)  # Also print to console for visibility
-        
-        plt.rcParams['font.family'] = resolved_family
-        plt.rcParams['font.size'] = config.font_size
-        plt.rcParams['text.color'] = getattr(config, 'text_color', '#000000')
-        
-        # Prepare X data (categorical or numeric)
+        # Prepare X data (categorical or numeric), coerced to an ndarray once
+        # so matplotlib doesn't re-run np.asanyarray on it for every line
         x_labels = None
         if config.x_axis.categorical:
             x_labels = list(data['x'])
-            x_values = list(range(len(x_labels)))
+            x_values = np.arange(len(x_labels), dtype=np.float64)
         else:
-            x_values = data['x']
+            x_values = np.asarray(data['x'])
 
         # Plot primary Y-axis lines
-        primary_lines = config.get_primary_lines()
-        for line_config in primary_lines:
-            if line_config.column not in data:
-                continue
-
-            # Prepare series (apply smoothing if requested)
-            y_values = data[line_config.column]
-            y_values = self._apply_smoothing(y_values, line_config)
-
-            ax1.plot(
-                x_values,
-                y_values,
-                label=line_config.label,
-                color=line_config.color,
-                linestyle=line_config.style,
-                linewidth=line_config.width,
-                marker=line_config.marker if line_config.marker else None,
-                markersize=line_config.marker_size,
-                markerfacecolor=line_config.color,
-                markeredgecolor=line_config.color,
-                solid_capstyle='round',
-                solid_joinstyle='round',
-                dash_joinstyle='round',
-                antialiased=True
-            )
+        self._plot_lines(ax1, x_values, data, config.get_primary_lines())
         
         # Configure primary Y-axis
         self._configure_axis(ax1, config.y_axis, is_y_axis=True)
@@ -151,92 +216,113 @@ class ChartEngine:
         # Create secondary Y-axis if enabled
         ax2 = None
         if config.y2_axis is not None:
-            ax2 = ax1.twinx()
+            ax2 = self._ax2 = ax1.twinx()
             
             # Plot lines assigned to secondary Y-axis
-            secondary_lines = config.get_secondary_lines()
-            for line_config in secondary_lines:
-                if line_config.column not in data:
-                    continue
-
-                # Prepare series (apply smoothing if requested)
-                y2_values = data[line_config.column]
-                y2_values = self._apply_smoothing(y2_values, line_config)
-
-                ax2.plot(
-                    x_values,
-                    y2_values,
-                    label=line_config.label,
-                    color=line_config.color,
-                    linestyle=line_config.style,
-                    linewidth=line_config.width,
-                    marker=line_config.marker if line_config.marker else None,
-                    markersize=line_config.marker_size,
-                    markerfacecolor=line_config.color,
-                    markeredgecolor=line_config.color,
-                    solid_capstyle='round',
-                    solid_joinstyle='round',
-                    dash_joinstyle='round',
-                    antialiased=True
-                )
+            self._plot_lines(ax2, x_values, data, config.get_secondary_lines())
             
             # Configure secondary Y-axis
             self._configure_axis(ax2, config.y2_axis, is_y_axis=True)
         
         # Configure X-axis (pass labels if categorical)
         self._configure_axis(ax1, config.x_axis, is_y_axis=False, labels=x_labels)
+
+        # Tick label fonts used to come from global rcParams; apply them per
+        # artist now that the figure bypasses pyplot.
+        for ax in (ax1,) if ax2 is None else (ax1, ax2):
+            for lab in (*ax.get_xticklabels(), *ax.get_yticklabels()):
+                lab.set_fontfamily(resolved_family)
+                lab.set_fontsize(config.font_size)
         
-        # Helper to map a period boundary to the plotted x-axis
+        # Helper to map a period boundary to the plotted x-axis. The lookup
+        # tables are built once, so K boundaries cost O(K+N) instead of a
+        # full label scan (with per-label coercions) per boundary.
+        label_num_index = {}
+        label_str_index = {}
+        if x_labels and config.period_highlights:
+            if all(isinstance(label, (int, float)) for label in x_labels):
+                # Pure-numeric labels: resolve every boundary in one
+                # vectorized binary-search pass instead of populating a full
+                # value->index dict (stable argsort + 'left' insertion keep
+                # first-occurrence semantics for duplicate labels).
+                arr = np.asarray(x_labels, dtype=np.float64)
+                order = np.argsort(arr, kind='stable')
+                sorted_arr = arr[order]
+                bounds = []
+                for period in config.period_highlights:
+                    for value in (period.start, period.end):
+                        try:
+                            bounds.append(float(value))
+                        except (ValueError, TypeError):
+                            pass
+                if bounds:
+                    positions_in_sorted = np.searchsorted(sorted_arr, bounds)
+                    for value, pos in zip(bounds, positions_in_sorted):
+                        if pos < sorted_arr.size and sorted_arr[pos] == value:
+                            label_num_index[value] = int(order[pos])
+                for idx, label in enumerate(x_labels):
+                    label_str_index.setdefault(str(label), idx)
+            else:
+                for idx, label in enumerate(x_labels):
+                    if isinstance(label, (int, float)):
+                        label_num_index.setdefault(float(label), idx)
+                    label_str_index.setdefault(str(label), idx)
+
         def _resolve_period_position(value):
             if value is None:
                 return None
             if x_labels:
                 # Try numeric match first, then string match, fallback to bounds
-                for idx, label in enumerate(x_labels):
-                    try:
-                        if isinstance(label, (int, float)) and float(value) == float(label):
-                            return idx
-                    except (ValueError, TypeError):
-                        pass
-                    if str(label) == str(value):
+                try:
+                    idx = label_num_index.get(float(value))
+                    if idx is not None:
                         return idx
-                return len(x_labels) - 1 if value is not None else 0
+                except (ValueError, TypeError):
+                    pass
+                idx = label_str_index.get(str(value))
+                if idx is not None:
+                    return idx
+                return len(x_labels) - 1
             try:
                 return float(value)
             except (ValueError, TypeError):
                 return None
 
         # Apply period highlights (background shading)
-        for period in config.period_highlights:
-            if period.start is not None and period.end is not None:
-                try:
-                    start_val = _resolve_period_position(period.start)
-                    end_val = _resolve_period_position(period.end)
-                    if start_val is None or end_val is None:
-                        continue
-
-                    ax1.axvspan(start_val, end_val, alpha=period.alpha, color=period.color, zorder=0)
-                    if period.label:
-                        mid = (start_val + end_val) / 2
-                        y_pos = ax1.get_ylim()[1] * 0.95
-                        ax1.text(mid, y_pos, period.label, ha='center', va='top', 
-                                fontsize=9, color=period.color, alpha=0.6, style='italic')
-                except (ValueError, TypeError):
-                    # Skip invalid period
-                    pass
+        if config.period_highlights:
+            # get_ylim resolves autoscale; read it once for the label row
+            # instead of once per highlight (axvspan doesn't change ylim).
+            y_pos = ax1.get_ylim()[1] * 0.95
+            for period in config.period_highlights:
+                if period.start is not None and period.end is not None:
+                    try:
+                        start_val = _resolve_period_position(period.start)
+                        end_val = _resolve_period_position(period.end)
+                        if start_val is None or end_val is None:
+                            continue
+
+                        ax1.axvspan(start_val, end_val, alpha=period.alpha, color=period.color, zorder=0)
+                        if period.label:
+                            mid = (start_val + end_val) / 2
+                            ax1.text(mid, y_pos, period.label, ha='center', va='top',
+                                    fontsize=9, color=period.color, alpha=0.6, style='italic')
+                    except (ValueError, TypeError):
+                        # Skip invalid period
+                        pass
         
         # Set title with alignment, offset, and theme text color
         ax1.set_title(
             config.title,
             fontsize=config.title_fontsize,
             fontweight=config.title_fontweight,
-            color=getattr(config, 'text_color', config.y_axis.color),
+            fontfamily=resolved_family,
+            color=title_text_color,
             loc=config.title_loc,
             y=config.title_yoffset
         )
 
         # Optional subtitle with flexible positioning
-        if getattr(config, 'subtitle', ''):
+        if subtitle:
             subtitle_loc = getattr(config, 'subtitle_loc', 'chart_center')
             sub_y = config.title_yoffset + getattr(config, 'subtitle_yoffset', -0.06)
             
@@ -248,10 +334,11 @@ class ChartEngine:
                 sub_ha = 'left' if align == 'left' else 'right'
                 self.figure.text(
                     sub_x, sub_y,
-                    config.subtitle,
-                    fontsize=getattr(config, 'subtitle_fontsize', 12),
-                    fontweight=getattr(config, 'subtitle_fontweight', 'normal'),
-                    color=getattr(config, 'text_color', config.y_axis.color),
+                    subtitle,
+                    fontsize=subtitle_fontsize,
+                    fontweight=subtitle_fontweight,
+                    fontfamily=resolved_family,
+                    color=title_text_color,
                     ha=sub_ha, va='top'
                 )
             else:
@@ -265,20 +352,21 @@ class ChartEngine:
                     sub_x, sub_ha = 0.5, 'center'
                 ax1.text(
                     sub_x, sub_y,
-                    config.subtitle,
-                    fontsize=getattr(config, 'subtitle_fontsize', 12),
-                    fontweight=getattr(config, 'subtitle_fontweight', 'normal'),
-                    color=getattr(config, 'text_color', config.y_axis.color),
+                    subtitle,
+                    fontsize=subtitle_fontsize,
+                    fontweight=subtitle_fontweight,
+                    fontfamily=resolved_family,
+                    color=title_text_color,
                     ha=sub_ha, va='top',
                     transform=ax1.transAxes
                 )
         
         # Configure legend
         if config.legend.show:
-            handles1, labels1 = ax1.get_legend_handles_labels()
-            
+            handles1, labels1 = self._legend_entries(ax1)
+
             if ax2 is not None:
-                handles2, labels2 = ax2.get_legend_handles_labels()
+                handles2, labels2 = self._legend_entries(ax2)
                 handles = handles1 + handles2
                 labels = labels1 + labels2
             else:
@@ -293,7 +381,8 @@ class ChartEngine:
                     frameon=config.legend.frameon,
                     shadow=config.legend.shadow,
                     ncol=config.legend.ncol,
-                    fontsize=config.legend.fontsize,
+                    prop={'family': resolved_family, 'size': config.legend.fontsize},
+                    labelcolor=text_color,
                     framealpha=getattr(config.legend, 'framealpha', 0.8),
                     labelspacing=getattr(config.legend, 'labelspacing', 0.5),
                     handlelength=getattr(config.legend, 'handlelength', 2.0),
@@ -301,33 +390,177 @@ class ChartEngine:
                 )
                 if getattr(config.legend, 'title', ''):
                     lgd.set_title(config.legend.title)
-        
-        # Apply tight layout
-        if config.tight_layout:
-            self.figure.tight_layout()
-        
+                # The legend draws proxy artists that copy line colors at
+                # creation; remember the pairing so recolors reach them.
+                proxies = getattr(lgd, 'legend_handles', None)
+                if proxies is None:  # matplotlib < 3.7
+                    proxies = lgd.legendHandles
+                self._legend_proxies = list(zip(handles, proxies))
+
         return self.figure
 
+    @staticmethod
+    def _legend_entries(ax):
+        """Labeled handles/labels of an axes, in config order.
+
+        Style-group batching adds artists group-major, so the axes' own
+        ordering interleaves when line styles alternate. The per-line
+        zorder assigned in _plot_lines encodes the original config index;
+        sorting by it restores the legend order users configured.
+        """
+        handles, labels = ax.get_legend_handles_labels()
+        pairs = sorted(zip(handles, labels),
+                       key=lambda pair: pair[0].get_zorder())
+        return [h for h, _ in pairs], [l for _, l in pairs]
+
+    def _apply_line_colors(self, config: ChartConfig) -> bool:
+        """Recolor live artists if only line colors changed.
+
+        Returns True when `config` differs from the last rendered config
+        in nothing but LineConfig.color values and the recolor has been
+        applied in place; any other difference (data columns, styles,
+        axes, legend, figure geometry) returns False so the caller does
+        a full rebuild.
+        """
+        prev = self.config
+        if prev is None or len(config.lines) != len(prev.lines):
+            return False
+
+        # Everything outside the line list must be identical.
+        if replace(config, lines=prev.lines) != prev:
+            return False
+
+        recolor = []
+        for new, old in zip(config.lines, prev.lines):
+            if replace(new, color=old.color) != old:
+                return False
+            if new.color != old.color:
+                line = self._line_artists.get(new.column)
+                if line is None:
+                    return False
+                recolor.append((line, new.color))
+
+        for line, color in recolor:
+            line.set_color(color)
+            line.set_markerfacecolor(color)
+            line.set_markeredgecolor(color)
+            for handle, proxy in self._legend_proxies:
+                if handle is line:
+                    proxy.set_color(color)
+                    proxy.set_markerfacecolor(color)
+                    proxy.set_markeredgecolor(color)
+        return True
+
+    def _plot_lines(self, ax, x_values, data, line_configs):
+        """
+        Plot a set of configured lines, batching calls per shared style.
+
+        Lines with the same style/width/marker settings are issued as one
+        ax.plot call with a 2D y matrix: matplotlib still creates a Line2D
+        per column, but the kwargs validation and path-transform setup run
+        once per group instead of once per line. Per-line color, label and
+        stacking order are applied on the returned artists.
+
+        Args:
+            ax: Target axes
+            x_values: Shared x data
+            data: Column-name -> series mapping
+            line_configs: LineConfig objects to draw
+        """
+        groups = {}
+        order = {}
+        for line_config in line_configs:
+            if line_config.column not in data:
+                continue
+            order[line_config.column] = len(order)
+            key = (line_config.style, line_config.width, line_config.marker, line_config.marker_size)
+            groups.setdefault(key, []).append(line_config)
+
+        # Round caps/joins make the path code emit arcs at every vertex and
+        # antialiasing costs extra coverage work in Agg; drop both when the
+        # config asks for speed or the series is dense enough that the
+        # difference is invisible anyway.
+        fast = (
+            getattr(self.config, 'line_quality', 'high') == 'fast'
+            or len(x_values) > 10_000
+        )
+        joinstyle = 'miter' if fast else 'round'
+        capstyle = 'butt' if fast else 'round'
+        antialiased = not fast
+
+        for (style, width, marker, marker_size), group in groups.items():
+            ys = [self._apply_smoothing(data[lc.column], lc) for lc in group]
+            if len(group) > 1:
+                try:
+                    y_data = np.column_stack([np.asarray(y, dtype=np.float64) for y in ys])
+                except (ValueError, TypeError):
+                    # Ragged or non-numeric columns: plot them one by one
+                    y_data = None
+            else:
+                y_data = ys[0]
+
+            if y_data is not None:
+                lines = ax.plot(
+                    x_values,
+                    y_data,
+                    linestyle=style,
+                    linewidth=width,
+                    marker=marker if marker else None,
+                    markersize=marker_size,
+                    solid_capstyle=capstyle,
+                    solid_joinstyle=joinstyle,
+                    dash_joinstyle=joinstyle,
+                    antialiased=antialiased
+                )
+            else:
+                lines = [
+                    ax.plot(
+                        x_values,
+                        y,
+                        linestyle=style,
+                        linewidth=width,
+                        marker=marker if marker else None,
+                        markersize=marker_size,
+                        solid_capstyle=capstyle,
+                        solid_joinstyle=joinstyle,
+                        dash_joinstyle=joinstyle,
+                        antialiased=antialiased
+                    )[0]
+                    for y in ys
+                ]
+
+            for line, line_config in zip(lines, group):
+                line.set_color(line_config.color)
+                line.set_markerfacecolor(line_config.color)
+                line.set_markeredgecolor(line_config.color)
+                line.set_label(line_config.label)
+                # Keep the original config order as the visual stacking order
+                # even though grouping reorders the plot calls.
+                line.set_zorder(2 + order[line_config.column] * 1e-3)
+                self._line_artists[line_config.column] = line
+
     def _apply_smoothing(self, series, line_config):
-        """Apply smoothing to a series if requested (returns list/Series)."""
+        """Apply smoothing to a series if requested (returns an array-like
+        that matplotlib plots without a list round-trip)."""
         method = getattr(line_config, 'smoothing_method', 'none')
         window = max(1, int(getattr(line_config, 'smoothing_window', 1)))
         if method == 'moving_average' and window > 1:
             try:
-                s = pd.Series(series)
-                sm = s.rolling(window=window, center=True, min_periods=1).mean()
-                return sm.tolist()
+                import pandas as pd
+
+                s = series if isinstance(series, pd.Series) else pd.Series(series)
+                return s.rolling(window=window, center=True, min_periods=1).mean().to_numpy()
             except Exception:
-                # Fallback simple moving average without pandas if needed
-                vals = list(series)
-                n = len(vals)
-                out = []
+                # Fallback moving average without pandas: one prefix-sum pass
+                # instead of summing a fresh slice per index (O(N) vs O(N*window))
+                vals = np.asarray(list(series), dtype=np.float64)
+                n = vals.size
                 half = window // 2
-                for i in range(n):
-                    start = max(0, i - half)
-                    end = min(n, i + half + 1)
-                    out.append(sum(vals[start:end]) / (end - start))
-                return out
+                csum = np.concatenate(([0.0], np.cumsum(vals)))
+                idx = np.arange(n)
+                starts = np.maximum(0, idx - half)
+                ends = np.minimum(n, idx + half + 1)
+                return (csum[ends] - csum[starts]) / (ends - starts)
         return series
     
     def _configure_axis(self, ax, axis_config, is_y_axis: bool, labels=None):
@@ -339,11 +572,24 @@ class ChartEngine:
             axis_config: AxisConfig object
             is_y_axis: True if configuring Y-axis, False for X-axis
         """
-        # Set label
+        from matplotlib import ticker
+
+        global _DECIMAL_FMT
+        if _DECIMAL_FMT is None:
+            _DECIMAL_FMT = ticker.FormatStrFormatter('%.2f')
+
+        # Set label (fonts are per-artist now that rcParams stay untouched)
+        label_kwargs = {
+            'color': axis_config.color,
+            'fontweight': getattr(axis_config, 'label_fontweight', 'normal'),
+        }
+        if self._resolved_family is not None:
+            label_kwargs['fontfamily'] = self._resolved_family
+            label_kwargs['fontsize'] = self.config.font_size
         if is_y_axis:
-            ax.set_ylabel(axis_config.label, color=axis_config.color, fontweight=getattr(axis_config, 'label_fontweight', 'normal'))
+            ax.set_ylabel(axis_config.label, **label_kwargs)
         else:
-            ax.set_xlabel(axis_config.label, color=axis_config.color, fontweight=getattr(axis_config, 'label_fontweight', 'normal'))
+            ax.set_xlabel(axis_config.label, **label_kwargs)
         
         # Set axis color
         ax.tick_params(axis='y' if is_y_axis else 'x', colors=axis_config.color)
@@ -408,15 +654,20 @@ class ChartEngine:
         # Format ticks
         fmt = axis_config.value_format
         if fmt == 'percent':
-            ax.yaxis.set_major_formatter(ticker.PercentFormatter()) if is_y_axis else ax.xaxis.set_major_formatter(ticker.PercentFormatter())
+            # PercentFormatter reads its attached axis's view interval to
+            # pick the decimal count, so each axis needs its own instance.
+            (ax.yaxis if is_y_axis else ax.xaxis).set_major_formatter(
+                ticker.PercentFormatter())
         elif fmt == 'scientific':
+            # ScalarFormatter carries per-axis state (offset, data magnitude),
+            # so it has to stay a fresh instance.
             sf = ticker.ScalarFormatter(useMathText=True)
             sf.set_scientific(True)
             (ax.yaxis if is_y_axis else ax.xaxis).set_major_formatter(sf)
         elif fmt == 'integer':
             (ax.yaxis if is_y_axis else ax.xaxis).set_major_locator(ticker.MaxNLocator(integer=True))
         elif fmt == 'decimal':
-            (ax.yaxis if is_y_axis else ax.xaxis).set_major_formatter(ticker.FormatStrFormatter('%.2f'))
+            (ax.yaxis if is_y_axis else ax.xaxis).set_major_formatter(_DECIMAL_FMT)
 
         # Tick step (numeric axes only; skip for categorical labels)
         if axis_config.tick_step and not (labels is not None and not is_y_axis):
@@ -429,33 +680,40 @@ class ChartEngine:
             
             if axis_config.grouped_categorical:
                 # Extract year groups from labels like "2006 q1", "2006 q2", etc.
-                groups = []
-                group_positions = []
-                current_group = None
-                
-                for i, label in enumerate(labels):
-                    # Extract group prefix (text before first space)
-                    parts = str(label).split(None, 1)
-                    group = parts[0] if parts else str(label)
-                    
-                    if group != current_group:
-                        groups.append(group)
-                        group_positions.append(i)
-                        current_group = group
-                
-                # Set minor ticks at all positions (for grid lines)
-                ax.set_xticks(positions, minor=True)
-                ax.tick_params(axis='x', which='minor', length=4, grid_alpha=0.3)
+                # Split all labels at once (group = text before first space,
+                # whole label if no space) and find boundaries with a
+                # vectorized neighbor diff instead of a Python loop.
+                import pandas as pd
+
+                labs = pd.Series(labels).astype(str)
+                groups_arr = labs.str.split(n=1).str[0].fillna(labs).to_numpy()
+                if groups_arr.size:
+                    mask = np.concatenate(([True], groups_arr[1:] != groups_arr[:-1]))
+                    group_positions = np.flatnonzero(mask).tolist()
+                    groups = groups_arr[mask].tolist()
+                else:
+                    groups = []
+                    group_positions = []
                 
+                # Minor ticks exist only to carry per-position grid lines, so
+                # skip them entirely when the grid is off and draw them with
+                # zero-length tick marks when it is on: each visible tick
+                # costs matplotlib separate Line artists, and dense
+                # categorical axes have one per label.
+                if axis_config.grid:
+                    ax.set_xticks(positions, minor=True)
+                    ax.tick_params(axis='x', which='minor', length=0, width=0, grid_alpha=0.3)
+
                 # Set major ticks only at group boundaries
                 ax.set_xticks(group_positions)
                 ax.set_xticklabels(groups, rotation=axis_config.tick_rotation)
+                ax.tick_params(axis='x', which='major', length=4)
                 for lab in ax.get_xticklabels():
                     lab.set_color(axis_config.color)
-                
+
                 # Enable minor grid if main grid is on
                 if axis_config.grid:
-                    ax.grid(True, axis='x', which='minor', color=axis_config.grid_color, 
+                    ax.grid(True, axis='x', which='minor', color=axis_config.grid_color,
                            alpha=axis_config.grid_alpha * 0.5, linestyle=':')
             else:
                 ax.set_xticks(positions)
@@ -499,14 +757,40 @@ class ChartEngine:
         
         # Use config DPI if not specified
         save_dpi = dpi if dpi is not None else (self.config.dpi if self.config else 100)
-        
+
+        # bbox_inches='tight' forces an extra full render just to measure
+        # the crop box; only pay for it when the config asks for it.
+        bbox = 'tight' if getattr(self.config, 'savefig_bbox', 'standard') == 'tight' else None
+        facecolor = self.figure.get_facecolor()
+
+        # Vector output goes through matplotlib's Python SVG/PDF writers;
+        # mplcairo emits the same formats through the Cairo C library several
+        # times faster. Use it when installed (and no tight-crop measuring
+        # pass is needed), otherwise fall through to the stock writer.
+        if format in ('svg', 'pdf') and bbox is None:
+            try:
+                from mplcairo.base import FigureCanvasCairo
+            except ImportError:
+                pass
+            else:
+                prev_canvas = self.figure.canvas
+                try:
+                    canvas = FigureCanvasCairo(self.figure)
+                    if format == 'svg':
+                        canvas.print_svg(output_path, facecolor=facecolor)
+                    else:
+                        canvas.print_pdf(output_path, facecolor=facecolor)
+                    return
+                finally:
+                    self.figure.canvas = prev_canvas
+
         # Save the figure
         self.figure.savefig(
             output_path,
             format=format,
             dpi=save_dpi if format == 'png' else None,
-            bbox_inches='tight',
-            facecolor=self.figure.get_facecolor(),
+            bbox_inches=bbox,
+            facecolor=facecolor,
             edgecolor='none'
         )
     
@@ -521,7 +805,12 @@ class ChartEngine:
     
     def clear(self):
         """Clear the current figure and reset state."""
-        if self.figure is not None:
-            plt.close(self.figure)
-            self.figure = None
+        # The figure is not registered with pyplot, so dropping the
+        # references is enough to release it.
+        self.figure = None
+        self._ax1 = None
+        self._ax2 = None
         self.config = None
+        self._last_data = None
+        self._line_artists = {}
+        self._legend_proxies = []
@@ -4,9 +4,55 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QSpinBox, QDoubleSpinBox, QGroupBox, QCheckBox, QComboBox, QTabWidget, QScrollArea
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QDoubleValidator
 
+# Display text -> config value for the fixed combo boxes, so get_config
+# does dict lookups instead of lower()/replace() string work per call.
+# addItems pulls from the keys, keeping the two in sync.
+_SCALE_MAP = {"Linear": "linear", "Log": "log"}
+_FORMAT_MAP = {
+    "Auto": "auto",
+    "Decimal": "decimal",
+    "Scientific": "scientific",
+    "Percent": "percent",
+    "Integer": "integer",
+}
+_TITLE_LOC_MAP = {"Left": "left", "Center": "center", "Right": "right"}
+_SUBTITLE_LOC_MAP = {
+    "Chart Left": "chart_left",
+    "Chart Center": "chart_center",
+    "Chart Right": "chart_right",
+    "Figure Left": "figure_left",
+    "Figure Right": "figure_right",
+}
+
+# Item sequences built once from the maps above; three AxisControlWidgets
+# per panel would otherwise rebuild these per widget. The value tuples are
+# positionally aligned with the items, so get_config can index them by
+# currentIndex() without materializing the QString text at all.
+_SCALES = tuple(_SCALE_MAP)
+_SCALE_VALUES = tuple(_SCALE_MAP.values())
+_VALUE_FORMATS = tuple(_FORMAT_MAP)
+_FORMAT_VALUES = tuple(_FORMAT_MAP.values())
+_TITLE_ALIGNS = tuple(_TITLE_LOC_MAP)
+_TITLE_LOC_VALUES = tuple(_TITLE_LOC_MAP.values())
+_SUBTITLE_ALIGNS = tuple(_SUBTITLE_LOC_MAP)
+_SUBTITLE_LOC_VALUES = tuple(_SUBTITLE_LOC_MAP.values())
+
+# One validator serves every min/max field: QValidator holds no per-widget
+# state, so there is no need to construct one per QLineEdit. Built lazily
+# to keep module import free of QObject construction.
+_shared_double_validator = None
+
+
+def _double_validator() -> QDoubleValidator:
+    """Return the shared QDoubleValidator, creating it on first use."""
+    global _shared_double_validator
+    if _shared_double_validator is None:
+        _shared_double_validator = QDoubleValidator()
+    return _shared_double_validator
+
 
 class AxisControlWidget(QWidget):
     """Widget for configuring a single axis."""
@@ -23,8 +69,21 @@ class AxisControlWidget(QWidget):
         super().__init__(parent)
         
         self.axis_name = axis_name
+
+        # Debounce rapid edits (typing, spinbox scrubbing) into a single
+        # settings_changed emission so downstream re-renders fire once.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self.settings_changed)
+
+        self._config_cache = None
         self.setup_ui()
-        
+
+    def _on_changed(self, *_):
+        """Single slot for every control signal; debounces settings_changed."""
+        self._config_cache = None
+        self._emit_timer.start(150)
+
     def setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -36,7 +95,7 @@ class AxisControlWidget(QWidget):
         label_layout.addWidget(QLabel("Label:"))
         self.label_edit = QLineEdit()
         self.label_edit.setPlaceholderText(f"{self.axis_name} Label")
-        self.label_edit.textChanged.connect(lambda: self.settings_changed.emit())
+        self.label_edit.textChanged.connect(self._on_changed, Qt.DirectConnection)
         label_layout.addWidget(self.label_edit, 1)
         layout.addLayout(label_layout)
         
@@ -48,9 +107,9 @@ class AxisControlWidget(QWidget):
         self.min_edit = QLineEdit()
         self.min_edit.setPlaceholderText("Auto")
         self.min_edit.setMaximumWidth(80)
-        validator = QDoubleValidator()
+        validator = _double_validator()
         self.min_edit.setValidator(validator)
-        self.min_edit.textChanged.connect(lambda: self.settings_changed.emit())
+        self.min_edit.textChanged.connect(self._on_changed, Qt.DirectConnection)
         minmax_layout.addWidget(self.min_edit)
         
         # Max
@@ -59,7 +118,7 @@ class AxisControlWidget(QWidget):
         self.max_edit.setPlaceholderText("Auto")
         self.max_edit.setMaximumWidth(80)
         self.max_edit.setValidator(validator)
-        self.max_edit.textChanged.connect(lambda: self.settings_changed.emit())
+        self.max_edit.textChanged.connect(self._on_changed, Qt.DirectConnection)
         minmax_layout.addWidget(self.max_edit)
         
         minmax_layout.addStretch()
@@ -72,7 +131,7 @@ class AxisControlWidget(QWidget):
         self.rotation_spin.setRange(-90, 90)
         self.rotation_spin.setValue(0)
         self.rotation_spin.setSuffix("°")
-        self.rotation_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.rotation_spin.valueChanged.connect(self._on_changed, Qt.DirectConnection)
         rotation_layout.addWidget(self.rotation_spin)
         rotation_layout.addStretch()
         layout.addLayout(rotation_layout)
@@ -86,7 +145,7 @@ class AxisControlWidget(QWidget):
         self.step_spin.setValue(0.0)
         self.step_spin.setSingleStep(1.0)
         self.step_spin.setSpecialValueText("Auto")
-        self.step_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.step_spin.valueChanged.connect(self._on_changed, Qt.DirectConnection)
         step_layout.addWidget(self.step_spin)
         step_layout.addStretch()
         layout.addLayout(step_layout)
@@ -95,7 +154,7 @@ class AxisControlWidget(QWidget):
         cat_layout = QHBoxLayout()
         cat_layout.addWidget(QLabel("Categorical (show all labels):"))
         self.categorical_check = QCheckBox()
-        self.categorical_check.stateChanged.connect(lambda: self.settings_changed.emit())
+        self.categorical_check.stateChanged.connect(self._on_changed, Qt.DirectConnection)
         cat_layout.addWidget(self.categorical_check)
         cat_layout.addStretch()
         layout.addLayout(cat_layout)
@@ -104,7 +163,7 @@ class AxisControlWidget(QWidget):
         hide_layout = QHBoxLayout()
         hide_layout.addWidget(QLabel("Hide labels (grid only):"))
         self.hide_labels_check = QCheckBox()
-        self.hide_labels_check.stateChanged.connect(lambda: self.settings_changed.emit())
+        self.hide_labels_check.stateChanged.connect(self._on_changed, Qt.DirectConnection)
         hide_layout.addWidget(self.hide_labels_check)
         hide_layout.addStretch()
         layout.addLayout(hide_layout)
@@ -114,7 +173,7 @@ class AxisControlWidget(QWidget):
         grouped_layout.addWidget(QLabel("Group labels (year only):"))
         self.grouped_categorical_check = QCheckBox()
         self.grouped_categorical_check.setToolTip("Show only group prefix (e.g., '2006 q1' → '2006')")
-        self.grouped_categorical_check.stateChanged.connect(lambda: self.settings_changed.emit())
+        self.grouped_categorical_check.stateChanged.connect(self._on_changed, Qt.DirectConnection)
         grouped_layout.addWidget(self.grouped_categorical_check)
         grouped_layout.addStretch()
         layout.addLayout(grouped_layout)
@@ -123,8 +182,8 @@ class AxisControlWidget(QWidget):
         scale_layout = QHBoxLayout()
         scale_layout.addWidget(QLabel("Scale:"))
         self.scale_combo = QComboBox()
-        self.scale_combo.addItems(["Linear", "Log"])
-        self.scale_combo.currentTextChanged.connect(lambda: self.settings_changed.emit())
+        self.scale_combo.addItems(_SCALES)
+        self.scale_combo.currentTextChanged.connect(self._on_changed, Qt.DirectConnection)
         scale_layout.addWidget(self.scale_combo)
         scale_layout.addStretch()
         layout.addLayout(scale_layout)
@@ -133,14 +192,8 @@ class AxisControlWidget(QWidget):
         fmt_layout = QHBoxLayout()
         fmt_layout.addWidget(QLabel("Value Format:"))
         self.format_combo = QComboBox()
-        self.format_combo.addItems([
-            "Auto",
-            "Decimal",
-            "Scientific",
-            "Percent",
-            "Integer"
-        ])
-        self.format_combo.currentTextChanged.connect(lambda: self.settings_changed.emit())
+        self.format_combo.addItems(_VALUE_FORMATS)
+        self.format_combo.currentTextChanged.connect(self._on_changed, Qt.DirectConnection)
         fmt_layout.addWidget(self.format_combo)
         fmt_layout.addStretch()
         layout.addLayout(fmt_layout)
@@ -149,22 +202,37 @@ class AxisControlWidget(QWidget):
     
     def get_config(self) -> dict:
         """Get axis configuration."""
-        return {
+        cfg = self._config_cache
+        if cfg is not None:
+            return cfg
+        # Bind each widget read once; every .text()/.value() is a separate
+        # crossing into Qt.
+        min_text = self.min_edit.text()
+        max_text = self.max_edit.text()
+        step = self.step_spin.value()
+        cfg = self._config_cache = {
             'label': self.label_edit.text(),
-            'min_value': self.min_edit.text() if self.min_edit.text() else None,
-            'max_value': self.max_edit.text() if self.max_edit.text() else None,
+            'min_value': min_text or None,
+            'max_value': max_text or None,
             'tick_rotation': self.rotation_spin.value(),
-            'tick_step': self.step_spin.value() if self.step_spin.value() > 0 else 0,
+            'tick_step': step if step > 0 else 0,
             'categorical': self.categorical_check.isChecked(),
             'hide_labels': self.hide_labels_check.isChecked(),
             'grouped_categorical': self.grouped_categorical_check.isChecked(),
-            'scale': self.scale_combo.currentText().lower(),
-            'value_format': self.format_combo.currentText().lower(),
+            'scale': _SCALE_VALUES[self.scale_combo.currentIndex()],
+            'value_format': _FORMAT_VALUES[self.format_combo.currentIndex()],
         }
-    
+        return cfg
+
     def set_label(self, label: str):
-        """Set the label."""
-        self.label_edit.setText(label)
+        """Set the label programmatically with one aggregated change signal."""
+        edit = self.label_edit
+        edit.blockSignals(True)
+        try:
+            edit.setText(label)
+        finally:
+            edit.blockSignals(False)
+        self._on_changed()
 
 
 class AxisPanel(QWidget):
@@ -175,26 +243,95 @@ class AxisPanel(QWidget):
     def __init__(self, parent=None):
         """Initialize the axis panel."""
         super().__init__(parent)
+
+        # Same debounce as AxisControlWidget: coalesce bursts of edits into
+        # one emission instead of triggering a re-render per keystroke.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self.settings_changed)
+
+        self._config_cache = None
         self.setup_ui()
-    
+
+    def _on_changed(self, *_):
+        """Single slot for every control signal; debounces settings_changed."""
+        self._config_cache = None
+        self._emit_timer.start(150)
+
     def setup_ui(self):
         """Set up the user interface with tabbed layout."""
-        layout = QVBoxLayout(self)
-        
-        # Create tab widget
-        tabs = QTabWidget()
-        
-        # ==================== Titles Tab ====================
-        titles_tab = QWidget()
+        # Suppress per-child layout/paint scheduling while the tree is
+        # assembled; one layout pass runs when updates come back on.
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QVBoxLayout(self)
+
+            # Tab pages start as empty placeholders and are populated on
+            # first activation (the Y2 tab in particular is rarely opened),
+            # so the panel only pays for the controls the user actually
+            # visits. Anything that reads widgets directly goes through
+            # _ensure_tab / _ensure_all_tabs first.
+            tabs = self._tabs = QTabWidget()
+            self._tab_builders = {}
+            for index, (name, builder) in enumerate((
+                ("Titles", self._build_titles_tab),
+                ("X-Axis", self._build_x_tab),
+                ("Y1-Axis", self._build_y_tab),
+                ("Y2-Axis", self._build_y2_tab),
+                ("Figure", self._build_figure_tab),
+            )):
+                tabs.addTab(QWidget(), name)
+                self._tab_builders[index] = builder
+            # currentChanged is connected only after the tabs exist, so the
+            # addTab calls above cannot trigger builds.
+            tabs.currentChanged.connect(self._ensure_tab)
+            self._ensure_tab(0)  # the initially visible tab
+
+            layout.addWidget(tabs)
+            layout.addStretch()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _ensure_tab(self, index: int):
+        """Build the tab page at `index` if it has not been built yet."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            page = self._tabs.widget(index)
+            page.setUpdatesEnabled(False)
+            try:
+                builder(page)
+            finally:
+                page.setUpdatesEnabled(True)
+
+    def _ensure_all_tabs(self):
+        """Build any remaining tab pages (needed before reading get_config)."""
+        for index in list(self._tab_builders):
+            self._ensure_tab(index)
+
+    # Tab indices, in the order added by setup_ui.
+    _TITLES_TAB, _X_TAB, _Y_TAB, _Y2_TAB, _FIGURE_TAB = range(5)
+
+    def _make_bold_row(self, parent_layout) -> QCheckBox:
+        """Add a 'Bold label' checkbox row and return the checkbox."""
+        row = QHBoxLayout()
+        chk = QCheckBox("Bold label")
+        chk.stateChanged.connect(self._on_changed, Qt.DirectConnection)
+        row.addWidget(chk)
+        row.addStretch()
+        parent_layout.addLayout(row)
+        return chk
+
+    def _build_titles_tab(self, titles_tab):
+        """Populate the Titles tab page."""
         titles_layout = QVBoxLayout(titles_tab)
-        
+
         # Main title
         main_title_layout = QHBoxLayout()
         main_title_layout.addWidget(QLabel("Title:"))
         self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("Enter chart title...")
         self.title_edit.setText("Chart")
-        self.title_edit.textChanged.connect(lambda: self.settings_changed.emit())
+        self.title_edit.textChanged.connect(self._on_changed, Qt.DirectConnection)
         main_title_layout.addWidget(self.title_edit, 1)
         titles_layout.addLayout(main_title_layout)
 
@@ -202,8 +339,8 @@ class AxisPanel(QWidget):
         align_layout = QHBoxLayout()
         align_layout.addWidget(QLabel("Title Align:"))
         self.title_align_combo = QComboBox()
-        self.title_align_combo.addItems(["Left", "Center", "Right"]) 
-        self.title_align_combo.currentTextChanged.connect(lambda: self.settings_changed.emit())
+        self.title_align_combo.addItems(_TITLE_ALIGNS)
+        self.title_align_combo.currentTextChanged.connect(self._on_changed, Qt.DirectConnection)
         align_layout.addWidget(self.title_align_combo)
         
         align_layout.addWidget(QLabel("Vertical Offset:"))
@@ -211,7 +348,9 @@ class AxisPanel(QWidget):
         self.title_yoffset_spin.setRange(0.8, 1.2)
         self.title_yoffset_spin.setSingleStep(0.01)
         self.title_yoffset_spin.setValue(1.0)
-        self.title_yoffset_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        # Offsets are fine-tuned in many small steps and intermediate
+        # values are not interesting; only emit once editing is done.
+        self.title_yoffset_spin.editingFinished.connect(self._on_changed, Qt.DirectConnection)
         align_layout.addWidget(self.title_yoffset_spin)
         align_layout.addStretch()
         titles_layout.addLayout(align_layout)
@@ -221,18 +360,18 @@ class AxisPanel(QWidget):
         sub_layout.addWidget(QLabel("Subtitle:"))
         self.subtitle_edit = QLineEdit()
         self.subtitle_edit.setPlaceholderText("Optional subtitle...")
-        self.subtitle_edit.textChanged.connect(lambda: self.settings_changed.emit())
+        self.subtitle_edit.textChanged.connect(self._on_changed, Qt.DirectConnection)
         sub_layout.addWidget(self.subtitle_edit, 1)
         
         sub_layout.addWidget(QLabel("Size:"))
         self.subtitle_size_spin = QSpinBox()
         self.subtitle_size_spin.setRange(6, 24)
         self.subtitle_size_spin.setValue(12)
-        self.subtitle_size_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.subtitle_size_spin.valueChanged.connect(self._on_changed, Qt.DirectConnection)
         sub_layout.addWidget(self.subtitle_size_spin)
         
         self.subtitle_bold_check = QCheckBox("Bold")
-        self.subtitle_bold_check.stateChanged.connect(lambda: self.settings_changed.emit())
+        self.subtitle_bold_check.stateChanged.connect(self._on_changed, Qt.DirectConnection)
         sub_layout.addWidget(self.subtitle_bold_check)
         sub_layout.addStretch()
         titles_layout.addLayout(sub_layout)
@@ -241,9 +380,9 @@ class AxisPanel(QWidget):
         sub_align_layout = QHBoxLayout()
         sub_align_layout.addWidget(QLabel("Subtitle Align:"))
         self.subtitle_align_combo = QComboBox()
-        self.subtitle_align_combo.addItems(["Chart Left", "Chart Center", "Chart Right", "Figure Left", "Figure Right"])
+        self.subtitle_align_combo.addItems(_SUBTITLE_ALIGNS)
         self.subtitle_align_combo.setCurrentText("Chart Center")
-        self.subtitle_align_combo.currentTextChanged.connect(lambda: self.settings_changed.emit())
+        self.subtitle_align_combo.currentTextChanged.connect(self._on_changed, Qt.DirectConnection)
         sub_align_layout.addWidget(self.subtitle_align_combo)
 
         sub_align_layout.addWidget(QLabel("Offset from Title:"))
@@ -252,79 +391,59 @@ class AxisPanel(QWidget):
         self.subtitle_yoffset_spin.setSingleStep(0.01)
         self.subtitle_yoffset_spin.setValue(-0.06)
         self.subtitle_yoffset_spin.setToolTip("Vertical distance from title (negative = below)")
-        self.subtitle_yoffset_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.subtitle_yoffset_spin.editingFinished.connect(self._on_changed, Qt.DirectConnection)
         sub_align_layout.addWidget(self.subtitle_yoffset_spin)
         sub_align_layout.addStretch()
         titles_layout.addLayout(sub_align_layout)
         
         titles_layout.addStretch()
-        tabs.addTab(titles_tab, "Titles")
-        
-        # ==================== X-Axis Tab ====================
-        x_tab = QWidget()
+
+    def _build_x_tab(self, x_tab):
+        """Populate the X-Axis tab page."""
         x_layout = QVBoxLayout(x_tab)
-        
+
         self.x_axis_widget = AxisControlWidget("X-Axis")
-        self.x_axis_widget.settings_changed.connect(lambda: self.settings_changed.emit())
+        self.x_axis_widget.settings_changed.connect(self._on_changed, Qt.DirectConnection)
         x_layout.addWidget(self.x_axis_widget)
 
-        # Bold label toggle
-        x_bold_layout = QHBoxLayout()
-        self.x_label_bold_check = QCheckBox("Bold label")
-        self.x_label_bold_check.stateChanged.connect(lambda: self.settings_changed.emit())
-        x_bold_layout.addWidget(self.x_label_bold_check)
-        x_bold_layout.addStretch()
-        x_layout.addLayout(x_bold_layout)
+        self.x_label_bold_check = self._make_bold_row(x_layout)
         
         x_layout.addStretch()
-        tabs.addTab(x_tab, "X-Axis")
-        
-        # ==================== Y1-Axis Tab ====================
-        y_tab = QWidget()
+
+    def _build_y_tab(self, y_tab):
+        """Populate the Y1-Axis tab page."""
         y_layout = QVBoxLayout(y_tab)
-        
+
         self.y_axis_widget = AxisControlWidget("Y-Axis")
-        self.y_axis_widget.settings_changed.connect(lambda: self.settings_changed.emit())
+        self.y_axis_widget.settings_changed.connect(self._on_changed, Qt.DirectConnection)
         y_layout.addWidget(self.y_axis_widget)
 
-        y_bold_layout = QHBoxLayout()
-        self.y_label_bold_check = QCheckBox("Bold label")
-        self.y_label_bold_check.stateChanged.connect(lambda: self.settings_changed.emit())
-        y_bold_layout.addWidget(self.y_label_bold_check)
-        y_bold_layout.addStretch()
-        y_layout.addLayout(y_bold_layout)
+        self.y_label_bold_check = self._make_bold_row(y_layout)
         
         y_layout.addStretch()
-        tabs.addTab(y_tab, "Y1-Axis")
-        
-        # ==================== Y2-Axis Tab ====================
-        y2_tab = QWidget()
+
+    def _build_y2_tab(self, y2_tab):
+        """Populate the Y2-Axis tab page."""
         y2_layout = QVBoxLayout(y2_tab)
-        
+
         # Enable checkbox
         self.enable_y2_check = QCheckBox("Enable Secondary Y-Axis")
         self.enable_y2_check.stateChanged.connect(self.toggle_y2_axis)
-        self.enable_y2_check.stateChanged.connect(lambda: self.settings_changed.emit())
+        self.enable_y2_check.stateChanged.connect(self._on_changed, Qt.DirectConnection)
         y2_layout.addWidget(self.enable_y2_check)
         
         self.y2_axis_widget = AxisControlWidget("Y2-Axis")
-        self.y2_axis_widget.settings_changed.connect(lambda: self.settings_changed.emit())
+        self.y2_axis_widget.settings_changed.connect(self._on_changed, Qt.DirectConnection)
         y2_layout.addWidget(self.y2_axis_widget)
 
-        y2_bold_layout = QHBoxLayout()
-        self.y2_label_bold_check = QCheckBox("Bold label")
-        self.y2_label_bold_check.stateChanged.connect(lambda: self.settings_changed.emit())
-        y2_bold_layout.addWidget(self.y2_label_bold_check)
-        y2_bold_layout.addStretch()
-        y2_layout.addLayout(y2_bold_layout)
+        self.y2_label_bold_check = self._make_bold_row(y2_layout)
         
         y2_layout.addStretch()
-        tabs.addTab(y2_tab, "Y2-Axis")
-        
-        # ==================== Figure Tab ====================
-        fig_tab = QWidget()
+
+    def _build_figure_tab(self, fig_tab):
+        """Populate the Figure tab page."""
         fig_layout = QVBoxLayout(fig_tab)
-        
+
         size_layout = QHBoxLayout()
         
         size_layout.addWidget(QLabel("Width:"))
@@ -333,7 +452,7 @@ class AxisPanel(QWidget):
         self.width_spin.setValue(10.0)
         self.width_spin.setSingleStep(0.5)
         self.width_spin.setSuffix(" in")
-        self.width_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.width_spin.valueChanged.connect(self._on_changed, Qt.DirectConnection)
         size_layout.addWidget(self.width_spin)
         
         size_layout.addWidget(QLabel("Height:"))
@@ -342,17 +461,13 @@ class AxisPanel(QWidget):
         self.height_spin.setValue(6.0)
         self.height_spin.setSingleStep(0.5)
         self.height_spin.setSuffix(" in")
-        self.height_spin.valueChanged.connect(lambda: self.settings_changed.emit())
+        self.height_spin.valueChanged.connect(self._on_changed, Qt.DirectConnection)
         size_layout.addWidget(self.height_spin)
         
         size_layout.addStretch()
         fig_layout.addLayout(size_layout)
         fig_layout.addStretch()
-        tabs.addTab(fig_tab, "Figure")
-        
-        layout.addWidget(tabs)
-        layout.addStretch()
-        
+
     def toggle_y2_axis(self, state):
         """Enable/disable secondary Y-axis controls."""
         # Keep inputs editable so labels can be adjusted anytime; checkbox only controls inclusion
@@ -360,14 +475,18 @@ class AxisPanel(QWidget):
         
     def get_config(self) -> dict:
         """Get axis configuration."""
+        cfg = self._config_cache
+        if cfg is not None:
+            return cfg
+        self._ensure_all_tabs()
         cfg = {
             'title': self.title_edit.text(),
-            'title_loc': self.title_align_combo.currentText().lower(),
+            'title_loc': _TITLE_LOC_VALUES[self.title_align_combo.currentIndex()],
             'title_yoffset': self.title_yoffset_spin.value(),
             'subtitle': self.subtitle_edit.text(),
             'subtitle_fontsize': self.subtitle_size_spin.value(),
             'subtitle_fontweight': 'bold' if self.subtitle_bold_check.isChecked() else 'normal',
-            'subtitle_loc': self.subtitle_align_combo.currentText().lower().replace(' ', '_'),
+            'subtitle_loc': _SUBTITLE_LOC_VALUES[self.subtitle_align_combo.currentIndex()],
             'subtitle_yoffset': self.subtitle_yoffset_spin.value(),
             'x_axis': self.x_axis_widget.get_config(),
             'y_axis': self.y_axis_widget.get_config(),
@@ -382,22 +501,34 @@ class AxisPanel(QWidget):
         if cfg['y2_axis']:
             cfg['y2_axis']['label_fontweight'] = 'bold' if self.y2_label_bold_check.isChecked() else 'normal'
 
+        self._config_cache = cfg
         return cfg
         
     def set_x_label_suggestion(self, label: str):
         """Set a suggested X-axis label."""
+        self._ensure_tab(self._X_TAB)
         if not self.x_axis_widget.label_edit.text():
             self.x_axis_widget.set_label(label)
             
     def set_y_label_suggestion(self, label: str):
         """Set a suggested Y-axis label."""
+        self._ensure_tab(self._Y_TAB)
         if not self.y_axis_widget.label_edit.text():
             self.y_axis_widget.set_label(label)
 
     def set_y2_label_suggestion(self, label: str):
         """Set a suggested Y2-axis label and enable Y2."""
+        self._ensure_tab(self._Y2_TAB)
         if not self.y2_axis_widget.label_edit.text():
             self.y2_axis_widget.set_label(label)
-        # Auto-enable Y2 axis when a suggestion is provided
-        if not self.enable_y2_check.isChecked():
-            self.enable_y2_check.setChecked(True)
+        # Auto-enable Y2 axis when a suggestion is provided, without the
+        # stateChanged cascade; one aggregated emission covers both edits.
+        chk = self.enable_y2_check
+        if not chk.isChecked():
+            chk.blockSignals(True)
+            try:
+                chk.setChecked(True)
+            finally:
+                chk.blockSignals(False)
+            self.toggle_y2_axis(chk.checkState())
+            self._on_changed()
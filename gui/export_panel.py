@@ -8,6 +8,42 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Signal
 from pathlib import Path
 
+# The home directory is a process-lifetime constant; resolve it once
+# instead of per panel construction.
+_DEFAULT_DIR = str(Path.home())
+
+# Per-format metadata: (file dialog filter, default extension, whether the
+# DPI setting applies). Adding a format means adding one entry here.
+_FORMAT_INFO = {
+    'png': ("PNG Image (*.png)", ".png", True),
+    'svg': ("SVG Vector (*.svg)", ".svg", False),
+    'pdf': ("PDF Document (*.pdf)", ".pdf", False),
+}
+
+# Parsed once per widget from the same string object; the #exportButton
+# selector scopes the rules so the sheet could move to an app-wide
+# stylesheet without edits.
+_EXPORT_BUTTON_QSS = """
+    QPushButton#exportButton {
+        background-color: #0078D4;
+        color: white;
+        padding: 8px 16px;
+        font-weight: bold;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton#exportButton:hover {
+        background-color: #106EBE;
+    }
+    QPushButton#exportButton:pressed {
+        background-color: #005A9E;
+    }
+    QPushButton#exportButton:disabled {
+        background-color: #CCCCCC;
+        color: #666666;
+    }
+"""
+
 
 class ExportPanel(QWidget):
     """Panel for configuring chart export settings."""
@@ -18,7 +54,7 @@ class ExportPanel(QWidget):
         """Initialize the export panel."""
         super().__init__(parent)
         
-        self.last_directory = str(Path.home())
+        self.last_directory = _DEFAULT_DIR
         self.setup_ui()
         
     def setup_ui(self):
@@ -59,22 +95,15 @@ class ExportPanel(QWidget):
         preset_layout = QHBoxLayout()
         preset_layout.addWidget(QLabel("Presets:"))
         
-        dpi_72_btn = QPushButton("72 (Screen)")
-        dpi_72_btn.clicked.connect(lambda: self.dpi_spin.setValue(72))
-        preset_layout.addWidget(dpi_72_btn)
-        
-        dpi_150_btn = QPushButton("150 (Draft)")
-        dpi_150_btn.clicked.connect(lambda: self.dpi_spin.setValue(150))
-        preset_layout.addWidget(dpi_150_btn)
-        
-        dpi_300_btn = QPushButton("300 (Print)")
-        dpi_300_btn.clicked.connect(lambda: self.dpi_spin.setValue(300))
-        preset_layout.addWidget(dpi_300_btn)
-        
-        dpi_600_btn = QPushButton("600 (High)")
-        dpi_600_btn.clicked.connect(lambda: self.dpi_spin.setValue(600))
-        preset_layout.addWidget(dpi_600_btn)
-        
+        # One shared slot dispatched on the sender's stored value, instead
+        # of a closure per button.
+        for value, text in ((72, "72 (Screen)"), (150, "150 (Draft)"),
+                            (300, "300 (Print)"), (600, "600 (High)")):
+            btn = QPushButton(text)
+            btn.setProperty("dpi", value)
+            btn.clicked.connect(self._apply_dpi_preset)
+            preset_layout.addWidget(btn)
+
         dpi_layout.addLayout(dpi_select_layout)
         dpi_layout.addLayout(preset_layout)
         
@@ -104,26 +133,8 @@ class ExportPanel(QWidget):
         export_layout = QHBoxLayout()
         self.export_button = QPushButton("Export Chart")
         self.export_button.clicked.connect(self.request_export)
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D4;
-                color: white;
-                padding: 8px 16px;
-                font-weight: bold;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #106EBE;
-            }
-            QPushButton:pressed {
-                background-color: #005A9E;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #666666;
-            }
-        """)
+        self.export_button.setObjectName("exportButton")
+        self.export_button.setStyleSheet(_EXPORT_BUTTON_QSS)
         export_layout.addStretch()
         export_layout.addWidget(self.export_button)
         export_layout.addStretch()
@@ -137,28 +148,21 @@ class ExportPanel(QWidget):
         
         layout.addStretch()
         
+    def _apply_dpi_preset(self):
+        """Set the DPI spinbox from the clicked preset button's value."""
+        self.dpi_spin.setValue(self.sender().property("dpi"))
+
     def update_format_settings(self):
         """Update UI based on selected format."""
         format_type = self.format_combo.currentData()
-        
-        # DPI only applies to PNG
-        self.dpi_group.setEnabled(format_type == 'png')
-        
+
+        self.dpi_group.setEnabled(_FORMAT_INFO[format_type][2])
+
     def browse_output_location(self):
         """Open file dialog to select output location."""
         format_type = self.format_combo.currentData()
-        
-        # Set file filter based on format
-        if format_type == 'png':
-            file_filter = "PNG Image (*.png)"
-            default_ext = ".png"
-        elif format_type == 'svg':
-            file_filter = "SVG Vector (*.svg)"
-            default_ext = ".svg"
-        else:  # pdf
-            file_filter = "PDF Document (*.pdf)"
-            default_ext = ".pdf"
-        
+        file_filter, default_ext, _ = _FORMAT_INFO[format_type]
+
         # Suggest filename
         default_name = f"chart{default_ext}"
         default_path = str(Path(self.last_directory) / default_name)
@@ -171,13 +175,14 @@ class ExportPanel(QWidget):
         )
         
         if file_path:
-            # Ensure correct extension
+            # Ensure correct extension; reuse one Path for the suffix fix
+            # and the parent lookup.
             path = Path(file_path)
             if path.suffix.lower() != default_ext:
-                file_path = str(path.with_suffix(default_ext))
-            
-            self.path_edit.setText(file_path)
-            self.last_directory = str(Path(file_path).parent)
+                path = path.with_suffix(default_ext)
+
+            self.path_edit.setText(str(path))
+            self.last_directory = str(path.parent)
             
     def request_export(self):
         """Request chart export with current settings."""
@@ -192,7 +197,7 @@ class ExportPanel(QWidget):
             return
         
         format_type = self.format_combo.currentData()
-        dpi = self.dpi_spin.value() if format_type == 'png' else 100
+        dpi = self.dpi_spin.value() if _FORMAT_INFO[format_type][2] else 100
         
         self.export_requested.emit(output_path, format_type, dpi)
         
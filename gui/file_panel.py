@@ -2,14 +2,204 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QComboBox, QTableWidget, QTableWidgetItem, QFileDialog,
-    QGroupBox, QListWidget, QMessageBox, QLineEdit, QRadioButton,
-    QCheckBox, QHeaderView, QAbstractItemView, QButtonGroup
+    QComboBox, QTableView, QFileDialog,
+    QGroupBox, QListWidget, QMessageBox, QLineEdit,
+    QHeaderView, QAbstractItemView, QStyledItemDelegate, QStyle,
+    QStyleOptionButton, QApplication
 )
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import (
+    Signal, Qt, QTimer, QAbstractTableModel, QModelIndex, QObject, QThread,
+    QRect, QEvent
+)
+import sys
 from typing import Optional, List
 
-from utils.excel_reader import ExcelReader
+# numpy, pandas and ExcelReader (which itself imports pandas) are imported
+# inside the methods that first touch a workbook: pandas alone is a ~300ms
+# cold import, and none of it is needed just to show the panel.
+
+
+class PandasPreviewModel(QAbstractTableModel):
+    """Read-only table model over a small preview DataFrame.
+
+    The view asks data() only for visible cells, so no per-cell
+    QTableWidgetItem allocation happens regardless of sheet width.
+    """
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        import numpy as np
+        import pandas as pd
+
+        self._columns = [str(c) for c in df.columns]
+        # Stringify the whole block once in C (NaN -> empty cell) so
+        # data() is a plain array index with no per-cell str() calls.
+        values = df.to_numpy(dtype=object, copy=False)
+        self._values = np.where(pd.isna(values), '', values).astype(str)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._values)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._values[index.row(), index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section]
+        return None
+
+
+class ColumnRoleModel(QAbstractTableModel):
+    """Mapping-table model: column names plus their X/Y1/Y2 role flags.
+
+    The role flags live in the panel's _roles dict (shared by reference),
+    and X/Y exclusivity is enforced in setData, so the table carries no
+    per-row widgets at all.
+    """
+
+    HEADERS = ("Column", "X", "Y1", "Y2")
+    ROLE_KEYS = (None, 'x', 'y1', 'y2')
+
+    role_changed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._roles = {}
+        self._names = []
+
+    def set_columns(self, roles: dict):
+        """Swap in a new roles dict (one entry per column, in order)."""
+        self.beginResetModel()
+        self._roles = roles
+        self._names = list(roles)
+        self.endResetModel()
+
+    def refresh(self):
+        """Re-read all role flags after bulk mutations of the dict."""
+        if self._names:
+            self.dataChanged.emit(
+                self.index(0, 1), self.index(len(self._names) - 1, 3),
+                [Qt.CheckStateRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+    def data(self, index, role=Qt.DisplayRole):
+        col = index.column()
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return self._names[index.row()]
+        elif role == Qt.CheckStateRole:
+            checked = self._roles[self._names[index.row()]][self.ROLE_KEYS[col]]
+            return Qt.Checked if checked else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        """Toggle a role flag, keeping X exclusive and X/Y1/Y2 disjoint."""
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        key = self.ROLE_KEYS[index.column()]
+        if key is None:
+            return False
+        roles = self._roles[self._names[index.row()]]
+        if key == 'x':
+            if roles['x']:
+                return False  # radio semantics: re-clicking X is a no-op
+            for row, name in enumerate(self._names):
+                if self._roles[name]['x']:
+                    self._roles[name]['x'] = False
+                    self._refresh_row(row)
+            roles['x'] = True
+            roles['y1'] = roles['y2'] = False
+        else:
+            roles[key] = not roles[key]
+            if roles[key]:
+                roles['y2' if key == 'y1' else 'y1'] = False
+                roles['x'] = False
+        self._refresh_row(index.row())
+        self.role_changed.emit()
+        return True
+
+    def _refresh_row(self, row):
+        self.dataChanged.emit(
+            self.index(row, 1), self.index(row, 3), [Qt.CheckStateRole])
+
+
+class RoleDelegate(QStyledItemDelegate):
+    """Paints radio/check indicators for the role columns.
+
+    Purely paint-on-demand: memory stays O(visible rows) instead of three
+    live QWidgets per table row.
+    """
+
+    def paint(self, painter, option, index):
+        col = index.column()
+        if col == 0:
+            super().paint(painter, option, index)
+            return
+        style = (option.widget.style() if option.widget is not None
+                 else QApplication.style())
+        opt = QStyleOptionButton()
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        opt.state = QStyle.State_Enabled | (
+            QStyle.State_On if checked else QStyle.State_Off)
+        element = QStyle.CE_RadioButton if col == 1 else QStyle.CE_CheckBox
+        metric = (QStyle.PM_ExclusiveIndicatorWidth if col == 1
+                  else QStyle.PM_IndicatorWidth)
+        size = style.pixelMetric(metric, opt, option.widget)
+        rect = option.rect
+        opt.rect = QRect(rect.x() + (rect.width() - size) // 2,
+                         rect.y() + (rect.height() - size) // 2,
+                         size, size)
+        style.drawControl(element, opt, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (index.column() != 0
+                and event.type() == QEvent.MouseButtonRelease):
+            return model.setData(index, None, Qt.CheckStateRole)
+        return False
+
+
+class SheetLoader(QObject):
+    """Runs the full sheet parse on a worker thread.
+
+    The reader is only touched from the worker until finished/failed is
+    delivered back on the GUI thread.
+    """
+
+    finished = Signal(object)  # Emits the loaded DataFrame
+    failed = Signal(str)
+
+    def __init__(self, excel_reader, sheet_name):
+        super().__init__()
+        self._reader = excel_reader
+        self._sheet_name = sheet_name
+
+    def run(self):
+        try:
+            df = self._reader.load_sheet(self._sheet_name)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(df)
 
 
 class FilePanel(QWidget):
@@ -22,8 +212,48 @@ class FilePanel(QWidget):
     def __init__(self, parent=None):
         """Initialize the file panel."""
         super().__init__(parent)
-        
+
+        from utils.excel_reader import ExcelReader
         self.excel_reader = ExcelReader()
+
+        # Shadow copy of the mapping-table selection state, maintained by
+        # ColumnRoleModel.setData so reads never touch the view.
+        self._roles = {}
+        self._row_to_name = []
+        self._name_to_row = {}
+        self._lower_names = []
+        self._row_hidden = []
+
+        # Numeric column names per sheet; dtype scans are repeated work
+        # once a sheet is loaded, so they are memoized until a new file
+        # replaces the workbook.
+        self._numeric_cache = {}
+
+        # Worker thread for the full sheet parse; one load at a time.
+        # While a parse is in flight the reader's frame is off limits to
+        # the GUI thread (the worker mutates it in place), so selection
+        # emissions and plot-data reads are held until _on_sheet_loaded.
+        self._worker_thread = None
+        self._sheet_loader = None
+        self._sheet_ready = False
+
+        # Last prepared plot data, keyed by (sheet, x, y columns): UI
+        # signal chains ask for the same slice repeatedly.
+        self._plot_cache = None
+
+        # Last selection actually emitted; duplicate emissions are dropped.
+        self._last_emitted = None
+
+
+        # Coalesce bursts of role changes (auto-select, clear, populate
+        # defaults) into a single data_selected emission: handlers restart
+        # this 0 ms single-shot timer and the emit runs once the burst has
+        # drained from the event loop.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._do_emit_data_selection)
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -59,9 +289,15 @@ class FilePanel(QWidget):
         preview_group = QGroupBox("Data Preview")
         preview_layout = QVBoxLayout()
         
-        self.preview_table = QTableWidget()
+        self.preview_table = QTableView()
         self.preview_table.setMaximumHeight(150)
         self.preview_table.setAlternatingRowColors(True)
+        self.preview_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Fixed default width instead of resizeColumnsToContents, which
+        # would force a measuring pass over every column.
+        preview_header = self.preview_table.horizontalHeader()
+        preview_header.setSectionResizeMode(QHeaderView.Interactive)
+        preview_header.setDefaultSectionSize(100)
         preview_layout.addWidget(self.preview_table)
         
         preview_group.setLayout(preview_layout)
@@ -91,10 +327,13 @@ class FilePanel(QWidget):
         filter_layout.addWidget(self.clear_y2_btn)
         column_layout.addLayout(filter_layout)
 
-        # Mapping table
-        self.map_table = QTableWidget()
-        self.map_table.setColumnCount(4)
-        self.map_table.setHorizontalHeaderLabels(["Column", "X", "Y1", "Y2"])
+        # Mapping table: model/view with a paint-only role delegate;
+        # exclusivity rules live in the model's setData.
+        self.map_table = QTableView()
+        self._role_model = ColumnRoleModel(self)
+        self._role_model.role_changed.connect(self.emit_data_selection)
+        self.map_table.setModel(self._role_model)
+        self.map_table.setItemDelegate(RoleDelegate(self.map_table))
         self.map_table.verticalHeader().setVisible(False)
         self.map_table.setSelectionMode(QAbstractItemView.NoSelection)
         self.map_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -105,10 +344,6 @@ class FilePanel(QWidget):
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         column_layout.addWidget(self.map_table)
 
-        # Radio group to enforce single X
-        self.x_radio_group = QButtonGroup(self)
-        self.x_radio_group.setExclusive(True)
-
         column_group.setLayout(column_layout)
         layout.addWidget(column_group)
 
@@ -125,7 +360,7 @@ class FilePanel(QWidget):
             self,
             "Open Excel File",
             "",
-            "Excel Files (*.xlsx *.xls *.xlsm);;All Files (*)"
+            "Excel Files (*.xlsx *.xls *.xlsm *.xlsb);;All Files (*)"
         )
         
         if not file_path:
@@ -133,18 +368,27 @@ class FilePanel(QWidget):
         
         try:
             sheet_names = self.excel_reader.load_file(file_path)
-            
-            # Update UI
+            self._numeric_cache.clear()
+            self._plot_cache = None
+            self._last_emitted = None
+
+            # Update UI. clear() and addItems() both fire
+            # currentTextChanged, each of which would trigger a sheet
+            # load; block them and load the first sheet exactly once.
             self.file_path_label.setText(file_path)
-            self.sheet_combo.clear()
-            self.sheet_combo.addItems(sheet_names)
-            
-            # Load first sheet automatically
+            self.sheet_combo.blockSignals(True)
+            try:
+                self.sheet_combo.clear()
+                self.sheet_combo.addItems(sheet_names)
+                self.sheet_combo.setCurrentIndex(0)
+            finally:
+                self.sheet_combo.blockSignals(False)
+
+            # Load first sheet automatically; file_loaded is emitted by
+            # _on_sheet_loaded once the full parse lands.
             if sheet_names:
                 self.load_sheet(sheet_names[0])
-            
-            self.file_loaded.emit(self.excel_reader)
-            
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load file:\n{str(e)}")
             
@@ -157,197 +401,232 @@ class FilePanel(QWidget):
         """
         if not sheet_name:
             return
-        
+
+        # Same column names on a new sheet mean new data: both caches go,
+        # and the frame is unusable until the full parse lands.
+        self._plot_cache = None
+        self._last_emitted = None
+        self._sheet_ready = False
+
         try:
-            df = self.excel_reader.load_sheet(sheet_name)
-            
-            # Update preview table
-            self.update_preview_table(df)
-            
-            # Update mapping table
-            columns = self.excel_reader.get_columns()
-            self.populate_mapping_table(columns)
-            
-            # Update info
-            info = self.excel_reader.get_data_info()
-            self.info_label.setText(
-                f"Loaded: {info['rows']} rows × {info['columns']} columns"
-            )
-            
+            # Paint the preview and mapping table from a streamed read of
+            # the first rows; the full sheet parse happens afterwards, so
+            # first paint does not wait on it.
+            preview = self.excel_reader.load_sheet_preview(sheet_name)
+            self.update_preview_table(preview)
+
+            # Seed the numeric cache from preview dtypes so mapping
+            # defaults don't need the full frame either.
+            self._numeric_cache[sheet_name] = frozenset(
+                str(c) for c in
+                preview.select_dtypes(include=['number']).columns)
+            self.populate_mapping_table(
+                [str(c) for c in preview.columns], sheet_name)
+
+            # Full parse runs on a worker thread; _on_sheet_loaded picks
+            # up once it lands.
+            self._start_full_load(sheet_name)
+
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load sheet:\n{str(e)}")
-            
-    def update_preview_table(self, df):
-        """
-        Update the preview table with dataframe data.
-        
-        Args:
-            df: Pandas DataFrame to display
-        """
-        preview = df.head(5)
-        
-        self.preview_table.setRowCount(len(preview))
-        self.preview_table.setColumnCount(len(preview.columns))
-        self.preview_table.setHorizontalHeaderLabels(preview.columns.tolist())
-        
-        for i, row in enumerate(preview.itertuples(index=False)):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.preview_table.setItem(i, j, item)
-        
-        self.preview_table.resizeColumnsToContents()
-        
-    def populate_mapping_table(self, columns: List[str]):
-        """Populate the mapping table with columns and selection widgets."""
-        self.map_table.setRowCount(len(columns))
-        self.x_radio_group = QButtonGroup(self)  # reset group
-        self.x_radio_group.setExclusive(True)
 
-        numeric_cols = set()
-        try:
-            numeric_cols = set(self.excel_reader.get_numeric_columns())
-        except Exception:
-            pass
+    def _start_full_load(self, sheet_name: str):
+        """Parse the full sheet on a worker thread, keeping the UI live."""
+        self._finish_worker()
 
-        default_x = columns[0] if columns else None
+        # No new loads can start until this one reports back.
+        self.sheet_combo.setEnabled(False)
+        self.load_button.setEnabled(False)
+        self.info_label.setText("Loading sheet…")
 
-        for row, col_name in enumerate(columns):
-            # Column label cell
-            item = QTableWidgetItem(col_name)
-            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-            self.map_table.setItem(row, 0, item)
+        thread = self._worker_thread = QThread(self)
+        loader = self._sheet_loader = SheetLoader(self.excel_reader, sheet_name)
+        loader.moveToThread(thread)
+        thread.started.connect(loader.run)
+        loader.finished.connect(self._on_sheet_loaded)
+        loader.failed.connect(self._on_sheet_load_failed)
+        loader.finished.connect(thread.quit)
+        loader.failed.connect(thread.quit)
+        thread.finished.connect(self._on_load_thread_finished)
+        thread.start()
 
-            # X radio
-            x_radio = QRadioButton()
-            x_radio.toggled.connect(lambda checked, r=row: self.on_x_toggled(r, checked))
-            self.x_radio_group.addButton(x_radio)
-            self.map_table.setCellWidget(row, 1, x_radio)
+    def shutdown(self):
+        """Stop the background loader; call before the panel goes away."""
+        self._finish_worker()
 
-            # Y1 checkbox
-            y1_check = QCheckBox()
-            y1_check.stateChanged.connect(lambda _state, r=row: self.on_y_role_changed(r, 'y1'))
-            self.map_table.setCellWidget(row, 2, y1_check)
+    def _finish_worker(self):
+        """Wait out any in-flight load before starting another."""
+        if self._worker_thread is not None:
+            self._worker_thread.quit()
+            self._worker_thread.wait()
+            self._worker_thread = None
+            self._sheet_loader = None
 
-            # Y2 checkbox
-            y2_check = QCheckBox()
-            y2_check.stateChanged.connect(lambda _state, r=row: self.on_y_role_changed(r, 'y2'))
-            self.map_table.setCellWidget(row, 3, y2_check)
+    def _on_sheet_loaded(self, df):
+        """Full sheet parse finished: refresh info and notify listeners."""
+        self._sheet_ready = True
+        # Anything cached before this point was computed from the old
+        # frame; never let it answer for the new one.
+        self._plot_cache = None
+        # The preview-seeded numeric set can misclassify columns whose
+        # first rows are blank; replace it with the full-frame dtype scan.
+        try:
+            self._numeric_cache[self.excel_reader.current_sheet] = frozenset(
+                self.excel_reader.get_numeric_columns())
+        except Exception:
+            pass
+        info = self.excel_reader.get_data_info()
+        self.info_label.setText(
+            f"Loaded: {info['rows']} rows × {info['columns']} columns"
+        )
+        self.file_loaded.emit(self.excel_reader)
+        # Release the selection emission that was held back while the
+        # parse was in flight.
+        self.emit_data_selection()
 
-            # Defaults: first column as X, numeric others as Y1
-            if default_x and col_name == default_x:
-                x_radio.setChecked(True)
-            elif col_name in numeric_cols:
-                y1_check.setChecked(True)
+    def _on_sheet_load_failed(self, message: str):
+        """Full sheet parse failed: surface the error."""
+        QMessageBox.critical(self, "Error", f"Failed to load sheet:\n{message}")
 
-        self.emit_data_selection()
+    def _on_load_thread_finished(self):
+        """Re-enable controls once the worker thread winds down."""
+        self.sheet_combo.setEnabled(True)
+        self.load_button.setEnabled(True)
+        self._worker_thread = None
+        self._sheet_loader = None
+            
+    def update_preview_table(self, df):
+        """
+        Update the preview table with dataframe data.
 
-    def on_x_toggled(self, row: int, checked: bool):
-        """Ensure X selection is exclusive and not also in Y lists."""
-        if not checked:
-            return
-        # uncheck Y1/Y2 in that row
-        y1 = self.map_table.cellWidget(row, 2)
-        y2 = self.map_table.cellWidget(row, 3)
-        if isinstance(y1, QCheckBox):
-            y1.blockSignals(True); y1.setChecked(False); y1.blockSignals(False)
-        if isinstance(y2, QCheckBox):
-            y2.blockSignals(True); y2.setChecked(False); y2.blockSignals(False)
-        self.emit_data_selection()
+        Args:
+            df: Pandas DataFrame to display
+        """
+        self._preview_model = PandasPreviewModel(df.head(5), self)
+        self.preview_table.setModel(self._preview_model)
+        
+    def populate_mapping_table(self, columns: List[str], sheet_name: str):
+        """Populate the mapping table with columns and role defaults."""
+        # Headers come out of pandas/openpyxl as fresh str objects; intern
+        # them so the roles dict, row index and emitted tuples all share
+        # one object per name and dict/tuple comparisons are identity-fast.
+        columns = [sys.intern(c) if isinstance(c, str) else c
+                   for c in columns]
+        self._roles = {name: {'x': False, 'y1': False, 'y2': False}
+                       for name in columns}
+        self._row_to_name = list(columns)
+        self._name_to_row = {name: row for row, name in enumerate(columns)}
+        self._lower_names = [name.lower() for name in columns]
+        self._row_hidden = [False] * len(columns)
+
+        # Defaults: first column as X, numeric others as Y1. Written to
+        # the dict before the model reset, so no per-row signals fire.
+        if columns:
+            numeric_cols = self._numeric_columns(sheet_name)
+            self._roles[columns[0]]['x'] = True
+            for name in columns[1:]:
+                if name in numeric_cols:
+                    self._roles[name]['y1'] = True
 
-    def on_y_role_changed(self, row: int, role: str):
-        """Keep Y1/Y2 mutually exclusive per column and not equal to X."""
-        # If a Y role is checked, uncheck the other
-        y1 = self.map_table.cellWidget(row, 2)
-        y2 = self.map_table.cellWidget(row, 3)
-        x_radio = self.map_table.cellWidget(row, 1)
-        if role == 'y1' and isinstance(y1, QCheckBox) and y1.isChecked():
-            if isinstance(y2, QCheckBox):
-                y2.blockSignals(True); y2.setChecked(False); y2.blockSignals(False)
-            if isinstance(x_radio, QRadioButton) and x_radio.isChecked():
-                x_radio.setChecked(False)
-        elif role == 'y2' and isinstance(y2, QCheckBox) and y2.isChecked():
-            if isinstance(y1, QCheckBox):
-                y1.blockSignals(True); y1.setChecked(False); y1.blockSignals(False)
-            if isinstance(x_radio, QRadioButton) and x_radio.isChecked():
-                x_radio.setChecked(False)
+        self._role_model.set_columns(self._roles)
         self.emit_data_selection()
 
     def apply_filter(self, text: str):
         """Filter rows in mapping table by column name substring."""
+        # Match against lowercase names precomputed in
+        # populate_mapping_table and only touch rows whose visibility
+        # actually flips; per keystroke this avoids a text() round-trip
+        # and a setRowHidden call per row.
         t = (text or '').lower()
-        for row in range(self.map_table.rowCount()):
-            name = self.map_table.item(row, 0).text().lower() if self.map_table.item(row,0) else ''
-            self.map_table.setRowHidden(row, t not in name)
+        hidden = self._row_hidden
+        self.map_table.setUpdatesEnabled(False)
+        try:
+            for row, lower_name in enumerate(self._lower_names):
+                should_hide = bool(t) and t not in lower_name
+                if should_hide != hidden[row]:
+                    self.map_table.setRowHidden(row, should_hide)
+                    hidden[row] = should_hide
+        finally:
+            self.map_table.setUpdatesEnabled(True)
 
     def clear_column_role(self, role: str):
-        for row in range(self.map_table.rowCount()):
-            widget = self.map_table.cellWidget(row, 2 if role=='y1' else 3)
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(False)
+        for roles in self._roles.values():
+            roles[role] = False
+        self._role_model.refresh()
         self.emit_data_selection()
 
+    def _numeric_columns(self, sheet_name: str) -> frozenset:
+        """Numeric column names for a sheet, cached per sheet.
+
+        The sheet is named explicitly because the reader's current_sheet
+        lags behind while a load is in flight (the preview runs before
+        the full parse lands), so reading it here would answer for the
+        wrong sheet.
+        """
+        cols = self._numeric_cache.get(sheet_name)
+        if cols is None:
+            # The reader's full-frame scan is only meaningful once it
+            # actually holds this sheet.
+            if (self._sheet_ready
+                    and sheet_name == self.excel_reader.current_sheet):
+                try:
+                    cols = frozenset(self.excel_reader.get_numeric_columns())
+                except Exception:
+                    cols = frozenset()
+                self._numeric_cache[sheet_name] = cols
+            else:
+                cols = frozenset()
+        return cols
+
     def auto_select_numeric(self):
-        numeric = set()
-        try:
-            numeric = set(self.excel_reader.get_numeric_columns())
-        except Exception:
-            pass
-        # Clear Y1 first
-        self.clear_column_role('y1')
-        # Set Y1 for numeric columns except X
-        for row in range(self.map_table.rowCount()):
-            name = self.map_table.item(row, 0).text()
-            x_radio = self.map_table.cellWidget(row, 1)
-            if name in numeric and not (isinstance(x_radio, QRadioButton) and x_radio.isChecked()):
-                y1 = self.map_table.cellWidget(row, 2)
-                if isinstance(y1, QCheckBox):
-                    y1.setChecked(True)
+        numeric = self._numeric_columns(self.sheet_combo.currentText())
+        # Y1 on for numeric columns except X, off for everything else
+        for name, roles in self._roles.items():
+            roles['y1'] = name in numeric and not roles['x']
+            if roles['y1']:
+                roles['y2'] = False
+        self._role_model.refresh()
+        self.emit_data_selection()
                     
     def emit_data_selection(self):
-        """Emit signal with current data selection."""
-        x_column = None
-        y1_columns = []
-        y2_columns = []
-        for row in range(self.map_table.rowCount()):
-            item = self.map_table.item(row, 0)
-            if item is None:  # Skip if cell not yet populated
-                continue
-            name = item.text()
-            xr = self.map_table.cellWidget(row, 1)
-            y1 = self.map_table.cellWidget(row, 2)
-            y2 = self.map_table.cellWidget(row, 3)
-            if isinstance(xr, QRadioButton) and xr.isChecked():
-                x_column = name
-            if isinstance(y1, QCheckBox) and y1.isChecked():
-                y1_columns.append(name)
-            if isinstance(y2, QCheckBox) and y2.isChecked():
-                y2_columns.append(name)
+        """Schedule a coalesced data_selected emission."""
+        self._emit_timer.start()
+
+    def _do_emit_data_selection(self):
+        """Emit signal with current data selection, if it changed."""
+        # Hold emissions back while the full parse is still running;
+        # _on_sheet_loaded re-schedules once the frame is safe to read.
+        if not self._sheet_ready:
+            return
+
+        x_column, y1_columns, y2_columns = self._read_selection()
 
         if x_column and (y1_columns or y2_columns):
+            # Skip no-op emissions (e.g. a filter pass or a re-click on
+            # the already-selected X radio) so downstream replot chains
+            # only run when the selection actually differs.
+            selection = (x_column, tuple(y1_columns), tuple(y2_columns))
+            if selection == self._last_emitted:
+                return
+            self._last_emitted = selection
             self.data_selected.emit(x_column, y1_columns, y2_columns)
-            
+
+    def _read_selection(self):
+        """Read (x_column, y1_columns, y2_columns) from the selection index."""
+        x_column = next(
+            (name for name, roles in self._roles.items() if roles['x']), None)
+        y1_columns = [name for name, roles in self._roles.items() if roles['y1']]
+        y2_columns = [name for name, roles in self._roles.items() if roles['y2']]
+        return x_column, y1_columns, y2_columns
+
     def get_selected_data(self):
         """
         Get the currently selected data columns.
-        
+
         Returns:
             Tuple of (x_column, y1_columns, y2_columns) or (None, None, None)
         """
-        x_column = None
-        y1_columns = []
-        y2_columns = []
-        for row in range(self.map_table.rowCount()):
-            name = self.map_table.item(row, 0).text()
-            xr = self.map_table.cellWidget(row, 1)
-            y1 = self.map_table.cellWidget(row, 2)
-            y2 = self.map_table.cellWidget(row, 3)
-            if isinstance(xr, QRadioButton) and xr.isChecked():
-                x_column = name
-            if isinstance(y1, QCheckBox) and y1.isChecked():
-                y1_columns.append(name)
-            if isinstance(y2, QCheckBox) and y2.isChecked():
-                y2_columns.append(name)
+        x_column, y1_columns, y2_columns = self._read_selection()
 
         if x_column and (y1_columns or y2_columns):
             return x_column, y1_columns, y2_columns
@@ -360,14 +639,24 @@ class FilePanel(QWidget):
         Returns:
             Dictionary with plot data or None
         """
+        # The worker may be mutating the reader's frame in place; never
+        # read it mid-parse.
+        if not self._sheet_ready:
+            return None
+
         x_column, y1_columns, y2_columns = self.get_selected_data()
         combined = (y1_columns or []) + (y2_columns or [])
         all_y = list(dict.fromkeys(combined))  # preserve order while removing duplicates
-        
+
         if x_column and all_y:
+            key = (self.excel_reader.current_sheet, x_column, tuple(all_y))
+            if self._plot_cache is not None and self._plot_cache[0] == key:
+                return self._plot_cache[1]
             try:
-                return self.excel_reader.get_plot_data(x_column, all_y)
+                result = self.excel_reader.get_plot_data(x_column, all_y)
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Failed to get plot data:\n{str(e)}")
                 return None
+            self._plot_cache = (key, result)
+            return result
         return None
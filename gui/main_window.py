@@ -4,78 +4,225 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QTabWidget, QMessageBox, QLabel
 )
-from PySide6.QtCore import Qt, QTimer
+import time
+
+import numpy as np
+from PySide6.QtCore import Qt, QTimer, QObject, QThread, Signal, QSize
 from PySide6.QtGui import QPixmap, QImage
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import io
 
+from assets.comprehensive_styles import get_style
 from gui.file_panel import FilePanel
 from gui.style_panel import StylePanel
 from gui.axis_panel import AxisPanel
 from gui.export_panel import ExportPanel
 from engine.chart_engine import ChartEngine
-from engine.config_builder import ChartConfig, LineConfig, AxisConfig, LegendConfig
+from engine.config_builder import (
+    ChartConfig, LineConfig, AxisConfig, LegendConfig, PeriodHighlight
+)
+
+
+# Horizontal resolution the preview is rendered at; series much denser
+# than this carry no visible extra detail.
+_PREVIEW_WIDTH_PX = 800
+
+
+def _downsample_for_preview(plot_data, width=_PREVIEW_WIDTH_PX):
+    """Decimate plot data to roughly preview resolution.
+
+    Series longer than 4x the preview width are reduced to a min/max
+    pair per pixel-wide bucket, which preserves the drawn envelope
+    (spikes included) while cutting the points matplotlib walks from
+    millions to ~2x width. Returns the input unchanged when it is small
+    enough or contains non-numeric Y data.
+    """
+    n = len(plot_data['x'])
+    if n <= 4 * width:
+        return plot_data
+
+    bucket = n // width
+    m = width * bucket  # drop the ragged tail; invisible at this scale
+
+    out = {}
+    for key, series in plot_data.items():
+        if key == 'x':
+            continue
+        arr = np.asarray(series)
+        if not np.issubdtype(arr.dtype, np.number):
+            return plot_data
+        arr = arr[:m].reshape(width, bucket)
+        ys = np.empty(2 * width)
+        ys[0::2] = arr.min(axis=1)
+        ys[1::2] = arr.max(axis=1)
+        out[key] = ys
+
+    x = np.asarray(plot_data['x'])[:m].reshape(width, bucket)
+    xs = np.empty(2 * width, dtype=x.dtype)
+    xs[0::2] = x[:, 0]
+    xs[1::2] = x[:, bucket // 2]
+    out['x'] = xs
+    return out
+
+
+class RenderWorker(QObject):
+    """Renders charts headlessly on a worker thread.
+
+    Owns a private ChartEngine (and thus its own reused Figure) so the
+    GUI thread's export engine is never touched concurrently. Only the
+    final QImage crosses back to the GUI thread.
+    """
+
+    rendered = Signal(int, QImage)
+    failed = Signal(int, str)
+    export_finished = Signal(str)
+    export_failed = Signal(str)
+
+    def __init__(self, engine: ChartEngine):
+        super().__init__()
+        self._engine = engine
+
+    def render(self, job_id: int, plot_data, config):
+        """Render one chart and emit the rasterized image."""
+        try:
+            figure = self._engine.create_chart(plot_data, config)
+            figure.canvas.draw()
+            width, height = figure.canvas.get_width_height()
+            # .copy() detaches from the Agg buffer, which the next render
+            # will overwrite; converting to the native opaque format here
+            # keeps the GUI thread's QPixmap.fromImage a plain memcpy
+            # instead of a per-pixel swizzle. Charts are always opaque.
+            image = QImage(figure.canvas.buffer_rgba(), width, height,
+                           QImage.Format_RGBA8888)
+            image = image.convertToFormat(QImage.Format_RGB32)
+        except Exception as e:
+            self.failed.emit(job_id, str(e))
+            return
+        self.rendered.emit(job_id, image)
+
+    def export(self, plot_data, config, output_path: str, format: str,
+               dpi: int):
+        """Render at export DPI and save, off the GUI thread.
+
+        At 600 DPI the Agg buffer plus PNG encoding can take seconds;
+        queued behind any preview job on this thread, so the shared
+        engine is never used concurrently.
+        """
+        try:
+            self._engine.create_chart(plot_data, config)
+            self._engine.save_chart(output_path, format, dpi)
+        except Exception as e:
+            self.export_failed.emit(str(e))
+            return
+        self.export_finished.emit(output_path)
+
+    def clear(self):
+        """Release the engine's figure; call only with the thread stopped."""
+        self._engine.clear()
 
 
 class ChartPreviewWidget(QWidget):
-    """Widget for displaying chart preview."""
-    
+    """Widget for displaying chart preview.
+
+    Shows prerendered QImages blitted into a label; all matplotlib work
+    happens on the render worker, so this widget never blocks the event
+    loop on rasterization.
+    """
+
+    _PLACEHOLDER_TEXT = 'No Preview Available\n\nLoad data and configure chart'
+
     def __init__(self, parent=None):
         """Initialize the chart preview widget."""
         super().__init__(parent)
-        
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
-        
+
+        self._label = QLabel()
+        self._label.setAlignment(Qt.AlignCenter)
+        self._label.setStyleSheet("color: gray;")
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.canvas)
-        
-    def update_chart(self, figure: Figure):
-        """Update the displayed chart."""
-        # Replace the canvas with the new figure to preserve all styling
-        layout = self.layout()
-        if self.canvas is not None:
-            layout.removeWidget(self.canvas)
-            self.canvas.setParent(None)
-        
-        self.figure = figure
-        self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
-        self.canvas.draw()
-        
+        layout.addWidget(self._label)
+
+        self.clear()
+
+    def set_image(self, image: QImage):
+        """Display a prerendered chart image."""
+        # The image was rasterized at physical resolution; tagging it
+        # with the screen ratio makes Qt show it at logical size, crisp
+        # on hi-dpi displays.
+        image.setDevicePixelRatio(self.devicePixelRatio())
+        self._label.setPixmap(QPixmap.fromImage(image))
+
     def clear(self):
         """Clear the preview."""
-        # Show a simple placeholder figure
-        placeholder = Figure(figsize=(8, 6), dpi=100)
-        ax = placeholder.add_subplot(111)
-        ax.text(0.5, 0.5, 'No Preview Available\n\nLoad data and configure chart',
-            ha='center', va='center', fontsize=12, color='gray')
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.axis('off')
-        
-        self.update_chart(placeholder)
+        self._label.setText(self._PLACEHOLDER_TEXT)
+
+    def sizeHint(self) -> QSize:
+        """Default to roughly the preview render size."""
+        return QSize(800, 600)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
-    
+
+    # Queued across the thread boundary to the render worker.
+    _render_requested = Signal(int, object, object)
+    _export_requested = Signal(object, object, str, str, int)
+
+    # Control-tab indices
+    _DATA_TAB, _STYLE_TAB, _AXES_TAB, _EXPORT_TAB = range(4)
+
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
         
-        self.chart_engine = ChartEngine()
         self.current_data = None
         self.auto_update = True
+
+        # (config, plot_data) of the last rendered preview; redundant
+        # update signals (tab focus, unchanged settings) are skipped
+        # against it instead of re-rendering.
+        self._last_rendered = None
+
+        # Sub-configs built from the panels' config dicts, keyed on dict
+        # identity: the panels hand out one cached dict per state, so an
+        # unchanged panel means the dataclasses can be reused as-is.
+        self._panel_cfg_cache = None
+
+        # Preview renders run on a worker thread; each job carries a
+        # sequence number so results that arrive after a newer request
+        # was dispatched are dropped instead of flashing stale charts.
+        self._render_seq = 0
+        self._pending_render = None  # (job_id, config, plot_data)
+        # Measured wall time of the last render, driving the adaptive
+        # debounce. Seeded so the first debounce matches the old fixed
+        # 300 ms.
+        self._last_render_ms = 200.0
+        self._render_t0 = 0.0
+        # Start of the current debounce burst, for the latency deadline.
+        self._first_schedule_t = 0.0
+        # (full plot_data, decimated copy) used by preview renders.
+        self._preview_data_cache = None
+        self._render_thread = QThread(self)
+        self._render_worker = RenderWorker(ChartEngine())
+        self._render_worker.moveToThread(self._render_thread)
+        self._render_requested.connect(self._render_worker.render)
+        self._export_requested.connect(self._render_worker.export)
+        self._render_worker.rendered.connect(self._on_rendered)
+        self._render_worker.failed.connect(self._on_render_failed)
+        self._render_worker.export_finished.connect(self._on_export_finished)
+        self._render_worker.export_failed.connect(self._on_export_failed)
+        self._render_thread.start()
         
         self.setWindowTitle("Excel Chart Generator")
         self.setGeometry(100, 100, 1400, 800)
         
+        # Resolved StyleProfile for the current style combo selection,
+        # refreshed once per user action instead of per config build.
+        # Seeded when the style tab is first built.
+        self._style = None
+
         self.setup_ui()
         self.connect_signals()
-        
+
         # Initialize preview
         self.preview_widget.clear()
         
@@ -101,25 +248,27 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(5, 5, 5, 5)
         
-        # Create tab widget for control panels
+        # Create tab widget for control panels. Only the file panel is
+        # visible at startup; the other three are deep widget trees, so
+        # they start as placeholders and are built on first use (first
+        # click or first programmatic access), mirroring the lazy tabs
+        # inside AxisPanel.
         self.tab_widget = QTabWidget()
-        
+
         # File panel
         self.file_panel = FilePanel()
         self.tab_widget.addTab(self.file_panel, "📁 Data")
-        
-        # Style panel
-        self.style_panel = StylePanel()
-        self.tab_widget.addTab(self.style_panel, "🎨 Style")
-        
-        # Axis panel
-        self.axis_panel = AxisPanel()
-        self.tab_widget.addTab(self.axis_panel, "📊 Axes")
-        
-        # Export panel
-        self.export_panel = ExportPanel()
-        self.tab_widget.addTab(self.export_panel, "💾 Export")
-        
+
+        self.tab_widget.addTab(QWidget(), "🎨 Style")
+        self.tab_widget.addTab(QWidget(), "📊 Axes")
+        self.tab_widget.addTab(QWidget(), "💾 Export")
+        self._tab_builders = {
+            self._STYLE_TAB: self._build_style_tab,
+            self._AXES_TAB: self._build_axis_tab,
+            self._EXPORT_TAB: self._build_export_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+
         left_layout.addWidget(self.tab_widget)
         
         # Right panel - Preview
@@ -155,18 +304,60 @@ class MainWindow(QMainWindow):
         
     def connect_signals(self):
         """Connect signals between components."""
-        # File panel signals
+        # File panel signals; the lazy panels wire their own signals in
+        # their builders.
         self.file_panel.data_selected.connect(self.on_data_selected)
-        
-        # Style panel signals
-        self.style_panel.style_changed.connect(self.schedule_update)
-        
-        # Axis panel signals
-        self.axis_panel.settings_changed.connect(self.schedule_update)
-        
-        # Export panel signals
-        self.export_panel.export_requested.connect(self.export_chart)
-        
+        self.file_panel.file_loaded.connect(self._on_file_loaded)
+
+    def _on_file_loaded(self, _reader):
+        """Re-render once a full sheet parse lands.
+
+        Covers reloads where the selection tuple is unchanged (so
+        data_selected stays silent) but the underlying frame is new.
+        """
+        self.schedule_update()
+
+    def _ensure_tab(self, index: int):
+        """Build the panel behind a placeholder tab on first use."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        panel = builder()
+        tabs = self.tab_widget
+        # Swapping the placeholder re-fires currentChanged; silence it so
+        # the swap cannot recurse into this slot.
+        tabs.blockSignals(True)
+        try:
+            label = tabs.tabText(index)
+            current = tabs.currentIndex()
+            tabs.removeTab(index)
+            tabs.insertTab(index, panel, label)
+            tabs.setCurrentIndex(current)
+        finally:
+            tabs.blockSignals(False)
+
+    def _build_style_tab(self):
+        """Create the style panel and wire its signals."""
+        panel = self.style_panel = StylePanel()
+        panel.style_changed.connect(self.schedule_update)
+        panel.style_combo.currentTextChanged.connect(
+            self._on_style_name_changed)
+        self._on_style_name_changed(panel.style_combo.currentText())
+        return panel
+
+    def _build_axis_tab(self):
+        """Create the axis panel and wire its signals."""
+        panel = self.axis_panel = AxisPanel()
+        panel.settings_changed.connect(self.schedule_update)
+        return panel
+
+    def _build_export_tab(self):
+        """Create the export panel and wire its signals."""
+        panel = self.export_panel = ExportPanel()
+        panel.export_requested.connect(self.export_chart)
+        return panel
+
     def on_data_selected(self, x_column: str, y1_columns: list, y2_columns: list):
         """
         Handle data selection change.
@@ -176,65 +367,161 @@ class MainWindow(QMainWindow):
             y1_columns: List of primary Y columns
             y2_columns: List of secondary Y columns
         """
+        # Both panels are updated programmatically below; build them if
+        # their tabs were never opened.
+        self._ensure_tab(self._STYLE_TAB)
+        self._ensure_tab(self._AXES_TAB)
+
         # Update line styles in style panel
-        from assets.comprehensive_styles import get_style
-        try:
-            style = get_style(self.style_panel.style_combo.currentText())
-            line_colors = style['line_colors']
-        except:
+        if self._style is not None:
+            line_colors = self._style.line_colors
+        else:
             # Fallback to default colors
             line_colors = [
                 '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
                 '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf'
             ]
-        combined_columns = (y1_columns or []) + (y2_columns or [])
-        self.style_panel.update_line_styles(combined_columns, line_colors, y2_columns)
-        
-        # Set suggested axis labels
-        self.axis_panel.set_x_label_suggestion(x_column)
-        if len(y1_columns) == 1:
-            self.axis_panel.set_y_label_suggestion(y1_columns[0])
-        # Suggest Y2 axis label and enable Y2 automatically if a single Y2 column is selected
-        if len(y2_columns) == 1:
-            # If Y1 not set, leave as-is and set Y2 specifically
-            self.axis_panel.set_y2_label_suggestion(y2_columns[0])
-        
+        # The programmatic setters below each fire change signals; hold
+        # auto-update off so they cannot schedule (possibly half-
+        # configured) renders, then schedule exactly once.
+        self.auto_update = False
+        try:
+            combined_columns = (y1_columns or []) + (y2_columns or [])
+            self.style_panel.update_line_styles(combined_columns, line_colors, y2_columns)
+
+            # Set suggested axis labels
+            self.axis_panel.set_x_label_suggestion(x_column)
+            if len(y1_columns) == 1:
+                self.axis_panel.set_y_label_suggestion(y1_columns[0])
+            # Suggest Y2 axis label and enable Y2 automatically if a single Y2 column is selected
+            if len(y2_columns) == 1:
+                # If Y1 not set, leave as-is and set Y2 specifically
+                self.axis_panel.set_y2_label_suggestion(y2_columns[0])
+        finally:
+            self.auto_update = True
+
         # Schedule preview update
         self.schedule_update()
         
+    def _on_style_name_changed(self, style_name: str):
+        """Re-resolve the cached StyleProfile when the combo changes."""
+        try:
+            self._style = get_style(style_name)
+        except ValueError:
+            self._style = None
+
+    # A continuous burst (held slider) may keep postponing the debounce
+    # timer; past this deadline the preview updates anyway.
+    _MAX_UPDATE_LATENCY_MS = 500
+
     def schedule_update(self):
-        """Schedule a preview update (debounced)."""
-        if self.auto_update:
-            self.update_timer.start(300)  # 300ms debounce
+        """Schedule a preview update (debounced, with bounded latency)."""
+        if not self.auto_update:
+            return
+
+        now = time.perf_counter()
+        if not self.update_timer.isActive():
+            # Start of a new burst.
+            self._first_schedule_t = now
+            self.update_timer.start(self._debounce_ms())
+        elif (now - self._first_schedule_t) * 1000 >= self._MAX_UPDATE_LATENCY_MS:
+            # The burst has been deferring updates for too long; render
+            # on the next event-loop tick instead of waiting it out.
+            self.update_timer.start(0)
+        else:
+            self.update_timer.start(self._debounce_ms())
+
+    def _debounce_ms(self) -> int:
+        """Debounce interval scaled to how slow this chart renders.
+
+        Fast charts update in well under the old fixed 300 ms; heavy
+        charts stretch the window so slider drags coalesce instead of
+        queueing renders the worker cannot keep up with.
+        """
+        return int(max(50, min(500, 1.5 * self._last_render_ms)))
             
     def update_preview(self):
-        """Update the chart preview."""
+        """Dispatch a chart render to the worker thread."""
+        # A render is still in flight: re-arm instead of stacking another
+        # job behind it; the deferred pass picks up the newest state.
+        if self._pending_render is not None:
+            self.update_timer.start(self._debounce_ms())
+            return
+
         try:
             # Get plot data
             plot_data = self.file_panel.get_plot_data()
             if not plot_data:
                 self.preview_widget.clear()
                 self.status_label.setText("No data selected")
+                self._last_rendered = None
                 return
-            
-            self.current_data = plot_data
-            
+
             # Build configuration
             config = self.build_chart_config()
-            
-            # Generate chart
-            figure = self.chart_engine.create_chart(plot_data, config)
-            
-            # Update preview
-            self.preview_widget.update_chart(figure)
-            
-            self.status_label.setText("✓ Chart updated")
-            self.statusBar().showMessage("Preview updated successfully")
-            
+
+            # Previews render at screen resolution no matter what DPI the
+            # export panel asks for; only export_chart pays full DPI.
+            # (Agg buffer bytes scale with dpi squared.)
+            config.dpi = int(round(100 * self.preview_widget.devicePixelRatio()))
+
+            # Same data (the file panel serves one dict per selection, so
+            # identity is enough) and an equal config mean the image on
+            # screen is already correct; skip the matplotlib render.
+            if (self._last_rendered is not None
+                    and plot_data is self._last_rendered[1]
+                    and config == self._last_rendered[0]):
+                return
+
+            self.current_data = plot_data
+
+            # Previews render decimated data; exports keep full
+            # resolution via current_data. Cached per source dict so the
+            # worker sees a stable object for unchanged selections.
+            cached = self._preview_data_cache
+            if cached is not None and cached[0] is plot_data:
+                render_data = cached[1]
+            else:
+                render_data = _downsample_for_preview(plot_data)
+                self._preview_data_cache = (plot_data, render_data)
+
+            # Hand the render to the worker; the GUI thread only blits
+            # the finished image back in _on_rendered.
+            self._render_seq += 1
+            self._pending_render = (self._render_seq, config, plot_data)
+            self._render_t0 = time.perf_counter()
+            self.status_label.setText("Rendering…")
+            self._render_requested.emit(self._render_seq, render_data, config)
+
         except Exception as e:
             self.status_label.setText(f"✗ Error: {str(e)}")
             self.statusBar().showMessage(f"Error: {str(e)}")
             QMessageBox.warning(self, "Preview Error", f"Failed to generate preview:\n{str(e)}")
+
+    def _on_rendered(self, job_id: int, image: QImage):
+        """Blit a finished render, unless a newer request superseded it."""
+        if job_id != self._render_seq:
+            return
+
+        _, config, plot_data = self._pending_render
+        self._last_rendered = (config, plot_data)
+        self._pending_render = None
+        self._last_render_ms = (time.perf_counter() - self._render_t0) * 1000
+
+        self.preview_widget.set_image(image)
+        self.status_label.setText("✓ Chart updated")
+        self.statusBar().showMessage("Preview updated successfully")
+
+    def _on_render_failed(self, job_id: int, message: str):
+        """Surface a worker render failure for the newest request only."""
+        if job_id != self._render_seq:
+            return
+
+        self._pending_render = None
+        self.status_label.setText(f"✗ Error: {message}")
+        self.statusBar().showMessage(f"Error: {message}")
+        QMessageBox.warning(self, "Preview Error",
+                            f"Failed to generate preview:\n{message}")
             
     def build_chart_config(self) -> ChartConfig:
         """
@@ -243,98 +530,72 @@ class MainWindow(QMainWindow):
         Returns:
             ChartConfig object
         """
-        # Get configurations from panels
+        # Get configurations from panels (built on demand if their tabs
+        # were never opened)
+        self._ensure_tab(self._STYLE_TAB)
+        self._ensure_tab(self._AXES_TAB)
         style_config = self.style_panel.get_config()
         axis_config = self.axis_panel.get_config()
-        
+
+        # Both panels unchanged since the last build: every dataclass
+        # below would come out identical, so reuse the cached ones and
+        # only run the final ChartConfig assembly.
+        cached = self._panel_cfg_cache
+        if (cached is not None and cached[0] is axis_config
+                and cached[1] is style_config):
+            x_axis, y_axis, y2_axis, lines, legend, text_color = cached[2]
+            return self._assemble_chart_config(
+                axis_config, style_config,
+                x_axis, y_axis, y2_axis, lines, legend, text_color)
+
         # Resolve current comprehensive style for all settings
-        from assets.comprehensive_styles import get_style
-        try:
-            style = get_style(self.style_panel.style_combo.currentText())
-            axis_color = style.get('axis_color', '#333333')
-            text_color = style.get('text_color', '#000000')
-        except:
+        if self._style is not None:
+            axis_color = self._style.axis_color
+            text_color = self._style.text_color
+        else:
             # Fallback if style not found
             axis_color = '#333333'
             text_color = '#000000'
 
-        # Create axis configurations
+        # Shared grid settings, looked up once for both axes.
+        show_grid = style_config['show_grid']
+        grid_type = style_config.get('grid_type', 'y_only')
+        grid_color = style_config['grid_color']
+
+        # Create axis configurations. The panels' per-axis dicts are
+        # shaped as AxisConfig kwargs, so only the style-derived fields
+        # need spelling out.
         x_axis = AxisConfig(
-            label=axis_config['x_axis']['label'],
-            min_value=axis_config['x_axis']['min_value'],
-            max_value=axis_config['x_axis']['max_value'],
-            tick_rotation=axis_config['x_axis']['tick_rotation'],
             color=axis_color,
-            label_fontweight=axis_config['x_axis'].get('label_fontweight', 'normal'),
-            grid=style_config['show_grid'],
-            grid_type=style_config.get('grid_type', 'y_only'),
-            grid_color=style_config['grid_color'],
-            scale=axis_config['x_axis']['scale'],
-            value_format=axis_config['x_axis']['value_format'],
-            tick_step=axis_config['x_axis']['tick_step'],
-            categorical=axis_config['x_axis']['categorical'],
-            hide_labels=axis_config['x_axis']['hide_labels'],
-            grouped_categorical=axis_config['x_axis']['grouped_categorical']
+            grid=show_grid,
+            grid_type=grid_type,
+            grid_color=grid_color,
+            **axis_config['x_axis']
         )
-        
+
         y_axis = AxisConfig(
-            label=axis_config['y_axis']['label'],
-            min_value=axis_config['y_axis']['min_value'],
-            max_value=axis_config['y_axis']['max_value'],
-            tick_rotation=axis_config['y_axis']['tick_rotation'],
             color=axis_color,
-            label_fontweight=axis_config['y_axis'].get('label_fontweight', 'normal'),
-            grid=style_config['show_grid'],
-            grid_type=style_config.get('grid_type', 'y_only'),
-            grid_color=style_config['grid_color'],
-            scale=axis_config['y_axis']['scale'],
-            value_format=axis_config['y_axis']['value_format'],
-            tick_step=axis_config['y_axis']['tick_step'],
-            categorical=axis_config['y_axis']['categorical'],
-            hide_labels=axis_config['y_axis']['hide_labels'],
-            grouped_categorical=axis_config['y_axis']['grouped_categorical']
+            grid=show_grid,
+            grid_type=grid_type,
+            grid_color=grid_color,
+            **axis_config['y_axis']
         )
-        
+
         # Determine if y2_axis should be created (check if any line uses secondary axis OR if enable_y2_check is checked)
-        has_secondary_lines = any(line_data.get('use_secondary_axis', False) for line_data in style_config['line_configs'])
-        
+        has_secondary_lines = style_config['has_secondary_lines']
+
         y2_axis = None
         if axis_config['y2_axis'] or has_secondary_lines:
             # Use existing y2_axis config if available, otherwise create a default one
-            y2_config = axis_config['y2_axis'] if axis_config['y2_axis'] else {}
             y2_axis = AxisConfig(
-                label=y2_config.get('label', ''),
-                min_value=y2_config.get('min_value'),
-                max_value=y2_config.get('max_value'),
-                tick_rotation=y2_config.get('tick_rotation', 0),
                 color=axis_color,
-                label_fontweight=y2_config.get('label_fontweight', 'normal'),
                 grid=False,  # Don't show grid for secondary axis
-                grid_type=y2_config.get('grid_type', 'y_only'),
-                scale=y2_config.get('scale', 'linear'),
-                value_format=y2_config.get('value_format', 'auto'),
-                tick_step=y2_config.get('tick_step', 0),
-                categorical=y2_config.get('categorical', False),
-                hide_labels=y2_config.get('hide_labels', False),
-                grouped_categorical=y2_config.get('grouped_categorical', False)
+                **(axis_config['y2_axis'] or {})
             )
-        
-        # Create line configurations
-        lines = []
-        for line_data in style_config['line_configs']:
-            line = LineConfig(
-                column=line_data['column'],
-                label=line_data['column'],
-                color=line_data['color'],
-                style=line_data['style'],
-                width=line_data['width'],
-                marker=line_data['marker'],
-                marker_size=6.0,
-                use_secondary_axis=line_data['use_secondary_axis'],
-                smoothing_method=line_data.get('smoothing_method', 'none'),
-                smoothing_window=line_data.get('smoothing_window', 1)
-            )
-            lines.append(line)
+
+        # Create line configurations; label defaults to the column in
+        # LineConfig.__post_init__.
+        lines = [LineConfig(**ld) for ld in style_config['line_configs']]
         
         # Create legend configuration
         legend = LegendConfig(
@@ -347,16 +608,26 @@ class MainWindow(QMainWindow):
             handlelength=style_config['legend_handlelength'],
             handletextpad=style_config['legend_handletextpad']
         )
-        
+
+        self._panel_cfg_cache = (
+            axis_config, style_config,
+            (x_axis, y_axis, y2_axis, lines, legend, text_color))
+
+        return self._assemble_chart_config(
+            axis_config, style_config,
+            x_axis, y_axis, y2_axis, lines, legend, text_color)
+
+    def _assemble_chart_config(self, axis_config, style_config,
+                               x_axis, y_axis, y2_axis, lines, legend,
+                               text_color) -> ChartConfig:
+        """Assemble the final ChartConfig; always runs, cheap by design."""
         # Get X column
         x_column, _, _ = self.file_panel.get_selected_data()
-        
+
         # Get period highlights from special presets
         special_config = self.style_panel.get_special_preset_config()
-        period_highlights = []
-        for ph_data in special_config.get('period_highlights', []):
-            from engine.config_builder import PeriodHighlight
-            ph = PeriodHighlight(
+        period_highlights = [
+            PeriodHighlight(
                 name=ph_data.get('name', ''),
                 start=ph_data.get('start'),
                 end=ph_data.get('end'),
@@ -364,8 +635,9 @@ class MainWindow(QMainWindow):
                 alpha=ph_data.get('alpha', 0.1),
                 label=ph_data.get('label', '')
             )
-            period_highlights.append(ph)
-        
+            for ph_data in special_config.get('period_highlights', [])
+        ]
+
         # Create complete configuration
         config = ChartConfig(
             title=axis_config['title'],
@@ -407,38 +679,51 @@ class MainWindow(QMainWindow):
             # Ensure we have current data
             if self.current_data is None:
                 raise ValueError("No chart data available. Please configure a chart first.")
-            
-            # Build fresh configuration
+
+            # Build fresh configuration with export DPI
             config = self.build_chart_config()
-            
-            # Generate chart with export DPI
             config.dpi = dpi
-            figure = self.chart_engine.create_chart(self.current_data, config)
-            
-            # Save chart
-            self.chart_engine.save_chart(output_path, format, dpi)
-            
-            # Show success
-            self.export_panel.set_export_success(output_path)
-            self.statusBar().showMessage(f"Chart exported successfully to {output_path}")
-            
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Chart has been exported to:\n{output_path}"
-            )
-            
+
         except Exception as e:
-            self.export_panel.set_export_error(str(e))
-            self.statusBar().showMessage(f"Export failed: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Export Error",
-                f"Failed to export chart:\n{str(e)}"
-            )
+            self._on_export_failed(str(e))
+            return
+
+        # Hand the render+save to the worker thread; the UI stays live
+        # while Agg rasterizes and the encoder runs.
+        self.export_panel.export_button.setEnabled(False)
+        self.statusBar().showMessage("Exporting…")
+        self._export_requested.emit(
+            self.current_data, config, output_path, format, dpi)
+
+    def _on_export_finished(self, output_path: str):
+        """Report a completed worker export."""
+        self.export_panel.export_button.setEnabled(True)
+        self.export_panel.set_export_success(output_path)
+        self.statusBar().showMessage(f"Chart exported successfully to {output_path}")
+
+        QMessageBox.information(
+            self,
+            "Export Successful",
+            f"Chart has been exported to:\n{output_path}"
+        )
+
+    def _on_export_failed(self, message: str):
+        """Report a failed export."""
+        self.export_panel.export_button.setEnabled(True)
+        self.export_panel.set_export_error(message)
+        self.statusBar().showMessage(f"Export failed: {message}")
+        QMessageBox.critical(
+            self,
+            "Export Error",
+            f"Failed to export chart:\n{message}"
+        )
             
     def closeEvent(self, event):
         """Handle window close event."""
-        # Clean up
-        self.chart_engine.clear()
+        # Clean up: the file panel's sheet loader first (it may still be
+        # parsing), then the render thread.
+        self.file_panel.shutdown()
+        self._render_thread.quit()
+        self._render_thread.wait()
+        self._render_worker.clear()
         event.accept()
@@ -1,34 +1,57 @@
 """Style configuration panel for chart appearance."""
 
+import functools
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
     QSpinBox, QDoubleSpinBox, QPushButton, QGroupBox, QCheckBox,
     QColorDialog, QScrollArea, QFrame, QLineEdit, QTabWidget
 )
-from PySide6.QtCore import Signal, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Signal, Qt, QTimer, QSignalBlocker
+from PySide6.QtGui import QColor, QStandardItem, QStandardItemModel
+
+from assets.comprehensive_styles import GridType, get_style, get_style_names
+
+# Imported once here rather than inside the setup/config methods: the
+# module resolve happens at panel-module import instead of during first
+# paint, and the panel degrades gracefully when presets are absent.
+try:
+    from assets.themes import get_preset_names, get_special_preset
+except ImportError:
+    get_preset_names = None
+    get_special_preset = None
 
-from assets.comprehensive_styles import get_style_names
+
+# Setting a stylesheet makes Qt re-parse it; the per-color string is
+# tiny but rebuilt constantly while a style is applied, so the formatted
+# sheets are memoized across all ColorButtons. The constant border rule
+# lives in the application stylesheet (see main.main), keeping the
+# per-instance sheet down to the one property that varies.
+@functools.lru_cache(maxsize=256)
+def _bg_style(color: str) -> str:
+    return f"background-color: {color};"
 
 
 class ColorButton(QPushButton):
     """Button that displays and allows selecting a color."""
-    
+
     color_changed = Signal(str)
-    
+
     def __init__(self, initial_color: str = "#000000", parent=None):
         """Initialize the color button."""
         super().__init__(parent)
-        
-        self.current_color = initial_color
+
+        self.current_color = None
         self.setFixedSize(80, 25)
         self.update_color(initial_color)
         self.clicked.connect(self.choose_color)
-        
+
     def update_color(self, color: str):
-        """Update button color."""
+        """Update button color; no-op when the color is unchanged."""
+        if color == self.current_color:
+            return
         self.current_color = color
-        self.setStyleSheet(f"background-color: {color}; border: 1px solid #888;")
+        self.setStyleSheet(_bg_style(color))
         
     def choose_color(self):
         """Open color picker dialog."""
@@ -44,15 +67,50 @@ class ColorButton(QPushButton):
 
 class LineStyleWidget(QWidget):
     """Widget for configuring a single line's style."""
-    
-    style_changed = Signal()
-    
+
+    # Carries the column name so the panel can patch just this row's
+    # cached config instead of re-reading every widget.
+    style_changed = Signal(str)
+
+    # (display text, item data) pairs for the combos. The backing
+    # QStandardItemModels are built once per tuple and shared by every
+    # row's combobox, instead of re-populating identical items per line.
+    _STYLE_ITEMS = (
+        ('─ Solid', '-'), ('-- Dashed', '--'),
+        ('·· Dotted', ':'), ('-· Dash-Dot', '-.'))
+    _MARKER_ITEMS = (
+        ('None', ''), ('● Circle', 'o'), ('■ Square', 's'),
+        ('▲ Triangle', '^'), ('◆ Diamond', 'D'),
+        ('+ Plus', '+'), ('✕ Cross', 'x'))
+    _SMOOTH_ITEMS = (('No Smooth', 'none'), ('Moving Avg', 'moving_average'))
+    _shared_models = {}
+
+    @classmethod
+    def _item_model(cls, items) -> QStandardItemModel:
+        """Return the shared model for an item tuple, building it once."""
+        model = cls._shared_models.get(items)
+        if model is None:
+            model = QStandardItemModel()
+            for text, data in items:
+                item = QStandardItem(text)
+                item.setData(data, Qt.UserRole)
+                model.appendRow(item)
+            cls._shared_models[items] = model
+        return model
+
     def __init__(self, column_name: str, color: str = "#1f77b4", parent=None):
         """Initialize the line style widget."""
         super().__init__(parent)
-        
+
         self.column_name = column_name
-        
+
+        # Coalesce bursts of sub-widget changes into one emission per
+        # event-loop turn.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._emit_changed)
+
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 2, 0, 2)
         
@@ -63,17 +121,13 @@ class LineStyleWidget(QWidget):
         
         # Color picker
         self.color_button = ColorButton(color)
-        self.color_button.color_changed.connect(lambda: self.style_changed.emit())
+        self.color_button.color_changed.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.color_button)
         
         # Line style
         self.style_combo = QComboBox()
-        self.style_combo.addItems(['─ Solid', '-- Dashed', '·· Dotted', '-· Dash-Dot'])
-        self.style_combo.setItemData(0, '-')
-        self.style_combo.setItemData(1, '--')
-        self.style_combo.setItemData(2, ':')
-        self.style_combo.setItemData(3, '-.')
-        self.style_combo.currentIndexChanged.connect(lambda: self.style_changed.emit())
+        self.style_combo.setModel(self._item_model(self._STYLE_ITEMS))
+        self.style_combo.currentIndexChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.style_combo)
         
         # Line width
@@ -82,34 +136,25 @@ class LineStyleWidget(QWidget):
         self.width_spin.setValue(2.0)
         self.width_spin.setSingleStep(0.5)
         self.width_spin.setPrefix("Width: ")
-        self.width_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.width_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.width_spin)
         
         # Marker style
         self.marker_combo = QComboBox()
-        self.marker_combo.addItems(['None', '● Circle', '■ Square', '▲ Triangle', '◆ Diamond', '+ Plus', '✕ Cross'])
-        self.marker_combo.setItemData(0, '')
-        self.marker_combo.setItemData(1, 'o')
-        self.marker_combo.setItemData(2, 's')
-        self.marker_combo.setItemData(3, '^')
-        self.marker_combo.setItemData(4, 'D')
-        self.marker_combo.setItemData(5, '+')
-        self.marker_combo.setItemData(6, 'x')
-        self.marker_combo.currentIndexChanged.connect(lambda: self.style_changed.emit())
+        self.marker_combo.setModel(self._item_model(self._MARKER_ITEMS))
+        self.marker_combo.currentIndexChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.marker_combo)
         
         # Secondary axis checkbox
         self.secondary_check = QCheckBox("Y2")
         self.secondary_check.setToolTip("Use secondary Y-axis")
-        self.secondary_check.stateChanged.connect(lambda: self.style_changed.emit())
+        self.secondary_check.stateChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.secondary_check)
 
         # Smoothing method
         self.smooth_combo = QComboBox()
-        self.smooth_combo.addItems(['No Smooth', 'Moving Avg'])
-        self.smooth_combo.setItemData(0, 'none')
-        self.smooth_combo.setItemData(1, 'moving_average')
-        self.smooth_combo.currentIndexChanged.connect(lambda: self.style_changed.emit())
+        self.smooth_combo.setModel(self._item_model(self._SMOOTH_ITEMS))
+        self.smooth_combo.currentIndexChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.smooth_combo)
 
         # Smoothing window
@@ -117,11 +162,19 @@ class LineStyleWidget(QWidget):
         self.smooth_window_spin.setRange(1, 25)
         self.smooth_window_spin.setValue(3)
         self.smooth_window_spin.setPrefix("Win: ")
-        self.smooth_window_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.smooth_window_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         layout.addWidget(self.smooth_window_spin)
         
         layout.addStretch()
-        
+
+    def _schedule_emit(self, *_):
+        """Queue one style_changed emission for this event-loop turn."""
+        self._emit_timer.start()
+
+    def _emit_changed(self):
+        """Emit style_changed tagged with this row's column."""
+        self.style_changed.emit(self.column_name)
+
     def get_config(self) -> dict:
         """Get line configuration."""
         return {
@@ -136,8 +189,10 @@ class LineStyleWidget(QWidget):
         }
         
     def set_color(self, color: str):
-        """Set line color."""
-        self.color_button.update_color(color)
+        """Set line color, notifying listeners when it actually changes."""
+        if color != self.color_button.get_color():
+            self.color_button.update_color(color)
+            self._schedule_emit()
 
 
 class StylePanel(QWidget):
@@ -150,17 +205,76 @@ class StylePanel(QWidget):
         super().__init__(parent)
         
         self.line_widgets = {}
+        # Per-column line configs, patched row-by-row as rows change so
+        # get_config never re-reads every widget.
+        self._line_config_cache = {}
+        # Whole-config dict, reused identity-stable between changes (like
+        # AxisPanel's) so consumers can use `is` as a change check.
+        self._config_cache = None
+        self._current_style = None
+        # Detached LineStyleWidgets kept for columns that may reappear;
+        # see update_line_styles.
+        self._widget_pool = {}
+
+        # One style_changed per event-loop turn, however many sub-widget
+        # signals a theme apply or line rebuild fires.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.style_changed)
+
         self.setup_ui()
-        
+
+    def _schedule_emit(self, *_):
+        """Queue one style_changed emission for this event-loop turn."""
+        self._config_cache = None
+        self._emit_timer.start()
+
     def setup_ui(self):
         """Set up the user interface."""
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(8, 8, 8, 8)
-        tab = QTabWidget()
-        main_layout.addWidget(tab)
 
-        # --- General tab ---
-        general_tab = QWidget()
+        # Tab pages start as empty placeholders and are populated on
+        # first activation, mirroring AxisPanel: the Legend and Lines
+        # pages hold a dozen-plus controls the user may never open.
+        # Anything that reads their widgets directly goes through
+        # _ensure_tab / _ensure_all_tabs first.
+        tabs = self._tabs = QTabWidget()
+        self._tab_builders = {}
+        for index, (name, builder) in enumerate((
+            ("General", self._build_general_tab),
+            ("Legend", self._build_legend_tab),
+            ("Lines", self._build_lines_tab),
+        )):
+            tabs.addTab(QWidget(), name)
+            self._tab_builders[index] = builder
+        tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(0)  # the initially visible tab
+
+        main_layout.addWidget(tabs)
+
+    def _ensure_tab(self, index: int):
+        """Build the tab page at `index` if it has not been built yet."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            page = self._tabs.widget(index)
+            page.setUpdatesEnabled(False)
+            try:
+                builder(page)
+            finally:
+                page.setUpdatesEnabled(True)
+
+    def _ensure_all_tabs(self):
+        """Build any remaining tab pages (needed before reading get_config)."""
+        for index in list(self._tab_builders):
+            self._ensure_tab(index)
+
+    # Tab indices, in the order added by setup_ui.
+    _GENERAL_TAB, _LEGEND_TAB, _LINES_TAB = range(3)
+
+    def _build_general_tab(self, general_tab):
+        """Populate the General tab (style, colors, fonts, grid)."""
         general_layout = QVBoxLayout(general_tab)
         general_layout.setSpacing(8)
 
@@ -181,13 +295,10 @@ class StylePanel(QWidget):
         special_layout.addWidget(QLabel("Highlight:"))
         self.special_preset_combo = QComboBox()
         self.special_preset_combo.addItem("None")
-        from assets.themes import get_preset_names
-        try:
+        if get_preset_names is not None:
             self.special_preset_combo.addItems(get_preset_names())
-        except:
-            pass
         # Always emit so selecting "None" clears an active highlight
-        self.special_preset_combo.currentTextChanged.connect(lambda _: self.style_changed.emit())
+        self.special_preset_combo.currentTextChanged.connect(self._schedule_emit, Qt.DirectConnection)
         special_layout.addWidget(self.special_preset_combo, 1)
         special_group.setLayout(special_layout)
         general_layout.addWidget(special_group)
@@ -197,14 +308,14 @@ class StylePanel(QWidget):
         bg_layout = QHBoxLayout()
         bg_layout.addWidget(QLabel("Background:"))
         self.bg_color_button = ColorButton("#FFFFFF")
-        self.bg_color_button.color_changed.connect(lambda: self.style_changed.emit())
+        self.bg_color_button.color_changed.connect(self._schedule_emit, Qt.DirectConnection)
         bg_layout.addWidget(self.bg_color_button)
         bg_layout.addStretch()
         colors_layout.addLayout(bg_layout)
         gridc_layout = QHBoxLayout()
         gridc_layout.addWidget(QLabel("Grid:"))
         self.grid_color_button = ColorButton("#CCCCCC")
-        self.grid_color_button.color_changed.connect(lambda: self.style_changed.emit())
+        self.grid_color_button.color_changed.connect(self._schedule_emit, Qt.DirectConnection)
         gridc_layout.addWidget(self.grid_color_button)
         gridc_layout.addStretch()
         colors_layout.addLayout(gridc_layout)
@@ -225,7 +336,7 @@ class StylePanel(QWidget):
             'Lucida Sans', 'Lucida Grande', 'Impact',
             'Open Sans', 'Roboto'
         ])
-        self.font_family_combo.currentTextChanged.connect(lambda: self.style_changed.emit())
+        self.font_family_combo.currentTextChanged.connect(self._schedule_emit, Qt.DirectConnection)
         family_layout.addWidget(self.font_family_combo, 1)
         font_layout.addLayout(family_layout)
         size_layout = QHBoxLayout()
@@ -233,7 +344,7 @@ class StylePanel(QWidget):
         self.font_size_spin = QSpinBox()
         self.font_size_spin.setRange(6, 24)
         self.font_size_spin.setValue(10)
-        self.font_size_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.font_size_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         size_layout.addWidget(self.font_size_spin)
         size_layout.addStretch()
         font_layout.addLayout(size_layout)
@@ -242,7 +353,7 @@ class StylePanel(QWidget):
         self.title_size_spin = QSpinBox()
         self.title_size_spin.setRange(8, 36)
         self.title_size_spin.setValue(16)
-        self.title_size_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.title_size_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         title_size_layout.addWidget(self.title_size_spin)
         title_size_layout.addStretch()
         font_layout.addLayout(title_size_layout)
@@ -253,7 +364,7 @@ class StylePanel(QWidget):
         grid_settings_layout = QVBoxLayout()
         self.show_grid_check = QCheckBox("Show Grid")
         self.show_grid_check.setChecked(True)
-        self.show_grid_check.stateChanged.connect(lambda: self.style_changed.emit())
+        self.show_grid_check.stateChanged.connect(self._schedule_emit, Qt.DirectConnection)
         grid_settings_layout.addWidget(self.show_grid_check)
         
         # Grid type selector
@@ -265,7 +376,7 @@ class StylePanel(QWidget):
         self.grid_type_combo.setItemData(1, 'x_only')
         self.grid_type_combo.setItemData(2, 'y_only')
         self.grid_type_combo.setItemData(3, 'none')
-        self.grid_type_combo.currentIndexChanged.connect(lambda: self.style_changed.emit())
+        self.grid_type_combo.currentIndexChanged.connect(self._schedule_emit, Qt.DirectConnection)
         grid_type_layout.addWidget(self.grid_type_combo, 1)
         grid_type_layout.addStretch()
         grid_settings_layout.addLayout(grid_type_layout)
@@ -273,10 +384,9 @@ class StylePanel(QWidget):
         grid_settings_group.setLayout(grid_settings_layout)
         general_layout.addWidget(grid_settings_group)
         general_layout.addStretch()
-        tab.addTab(general_tab, "General")
 
-        # --- Legend tab ---
-        legend_tab = QWidget()
+    def _build_legend_tab(self, legend_tab):
+        """Populate the Legend tab."""
         legend_layout = QVBoxLayout(legend_tab)
         legend_layout.setSpacing(8)
 
@@ -284,20 +394,20 @@ class StylePanel(QWidget):
         lg_layout = QVBoxLayout()
         self.show_legend_check = QCheckBox("Show Legend")
         self.show_legend_check.setChecked(True)
-        self.show_legend_check.stateChanged.connect(lambda: self.style_changed.emit())
+        self.show_legend_check.stateChanged.connect(self._schedule_emit, Qt.DirectConnection)
         lg_layout.addWidget(self.show_legend_check)
         pos_layout = QHBoxLayout()
         pos_layout.addWidget(QLabel("Position:"))
         self.legend_position_combo = QComboBox()
         self.legend_position_combo.addItems(['best', 'upper right', 'upper left', 'lower right', 'lower left', 'center'])
-        self.legend_position_combo.currentTextChanged.connect(lambda: self.style_changed.emit())
+        self.legend_position_combo.currentTextChanged.connect(self._schedule_emit, Qt.DirectConnection)
         pos_layout.addWidget(self.legend_position_combo, 1)
         lg_layout.addLayout(pos_layout)
         title_layout = QHBoxLayout()
         title_layout.addWidget(QLabel("Legend Title:"))
         self.legend_title_edit = QLineEdit()
         self.legend_title_edit.setPlaceholderText("Optional legend title...")
-        self.legend_title_edit.textChanged.connect(lambda: self.style_changed.emit())
+        self.legend_title_edit.textChanged.connect(self._schedule_emit, Qt.DirectConnection)
         title_layout.addWidget(self.legend_title_edit, 1)
         lg_layout.addLayout(title_layout)
         cols_alpha_layout = QHBoxLayout()
@@ -305,14 +415,14 @@ class StylePanel(QWidget):
         self.legend_ncol_spin = QSpinBox()
         self.legend_ncol_spin.setRange(1, 4)
         self.legend_ncol_spin.setValue(1)
-        self.legend_ncol_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.legend_ncol_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         cols_alpha_layout.addWidget(self.legend_ncol_spin)
         cols_alpha_layout.addWidget(QLabel("Background Transparency:"))
         self.legend_alpha_spin = QDoubleSpinBox()
         self.legend_alpha_spin.setRange(0.0, 1.0)
         self.legend_alpha_spin.setSingleStep(0.05)
         self.legend_alpha_spin.setValue(0.8)
-        self.legend_alpha_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.legend_alpha_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         cols_alpha_layout.addWidget(self.legend_alpha_spin)
         cols_alpha_layout.addStretch()
         lg_layout.addLayout(cols_alpha_layout)
@@ -322,31 +432,30 @@ class StylePanel(QWidget):
         self.legend_labelspacing_spin.setRange(0.0, 5.0)
         self.legend_labelspacing_spin.setSingleStep(0.1)
         self.legend_labelspacing_spin.setValue(0.5)
-        self.legend_labelspacing_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.legend_labelspacing_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         spacing_layout.addWidget(self.legend_labelspacing_spin)
         spacing_layout.addWidget(QLabel("Line Length:"))
         self.legend_handlelength_spin = QDoubleSpinBox()
         self.legend_handlelength_spin.setRange(0.5, 10.0)
         self.legend_handlelength_spin.setSingleStep(0.5)
         self.legend_handlelength_spin.setValue(2.0)
-        self.legend_handlelength_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.legend_handlelength_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         spacing_layout.addWidget(self.legend_handlelength_spin)
         spacing_layout.addWidget(QLabel("Text Padding:"))
         self.legend_handletextpad_spin = QDoubleSpinBox()
         self.legend_handletextpad_spin.setRange(0.0, 5.0)
         self.legend_handletextpad_spin.setSingleStep(0.1)
         self.legend_handletextpad_spin.setValue(0.8)
-        self.legend_handletextpad_spin.valueChanged.connect(lambda: self.style_changed.emit())
+        self.legend_handletextpad_spin.valueChanged.connect(self._schedule_emit, Qt.DirectConnection)
         spacing_layout.addWidget(self.legend_handletextpad_spin)
         spacing_layout.addStretch()
         lg_layout.addLayout(spacing_layout)
         legend_group.setLayout(lg_layout)
         legend_layout.addWidget(legend_group)
         legend_layout.addStretch()
-        tab.addTab(legend_tab, "Legend")
 
-        # --- Lines tab ---
-        lines_tab = QWidget()
+    def _build_lines_tab(self, lines_tab):
+        """Populate the Lines tab (per-line style widgets)."""
         lines_layout = QVBoxLayout(lines_tab)
         lines_layout.setContentsMargins(0, 0, 0, 0)
         lines_scroll = QScrollArea()
@@ -365,8 +474,8 @@ class StylePanel(QWidget):
         lw_layout.addStretch()
         lines_scroll.setWidget(lines_widget)
         lines_layout.addWidget(lines_scroll)
-        tab.addTab(lines_tab, "Lines")
-        
+
+
     def update_line_styles(self, y_columns: list, theme_colors: list = None, y2_columns: list = None):
         """
         Update line style widgets for selected Y columns.
@@ -376,100 +485,166 @@ class StylePanel(QWidget):
             theme_colors: Optional list of colors from theme
             y2_columns: Optional list of columns that should default to secondary axis
         """
-        # Clear existing widgets
-        for widget in self.line_widgets.values():
-            widget.deleteLater()
-        self.line_widgets.clear()
+        # The swap below needs the Lines page's container widgets.
+        self._ensure_tab(self._LINES_TAB)
 
         if y2_columns is None:
             y2_columns = []
-        
-        # Get theme colors if not provided
+
+        # Get style colors if not provided
         if theme_colors is None:
-            from assets.themes import get_theme
-            theme = get_theme(self.theme_combo.currentText())
-            theme_colors = theme['line_colors']
-        
-        # Create new widgets
-        for i, column in enumerate(y_columns):
-            color = theme_colors[i % len(theme_colors)]
-            widget = LineStyleWidget(column, color)
-            widget.style_changed.connect(lambda: self.style_changed.emit())
-            widget.secondary_check.setChecked(column in y2_columns)
-            self.line_widgets[column] = widget
-            self.lines_container_layout.addWidget(widget)
+            theme_colors = get_style(self.style_combo.currentText()).line_colors
+
+        # Suppress repaints while the container is swapped; a single
+        # paint happens when updates are re-enabled.
+        self.setUpdatesEnabled(False)
+        try:
+            # Build the new widgets into a detached container first, then
+            # swap it in whole: one relayout pass instead of O(N) child
+            # insert/remove churn inside the live widget tree.
+            container = QWidget()
+            container_layout = QVBoxLayout(container)
+            container_layout.setContentsMargins(0, 0, 0, 0)
+
+            # Reuse rows whose columns are still (or again) selected —
+            # toggling one column then costs one widget construction at
+            # most, not a full rebuild. Reused rows keep their style
+            # tweaks; color and Y2 defaults are reapplied like before.
+            reusable = self.line_widgets
+            self.line_widgets = {}
+
+            for i, column in enumerate(y_columns):
+                color = theme_colors[i % len(theme_colors)]
+                widget = reusable.pop(column, None)
+                if widget is None:
+                    widget = self._widget_pool.pop(column, None)
+                if widget is None:
+                    widget = LineStyleWidget(column, color)
+                    widget.style_changed.connect(self._on_line_style_changed, Qt.DirectConnection)
+                else:
+                    widget.set_color(color)
+                widget.secondary_check.setChecked(column in y2_columns)
+                self.line_widgets[column] = widget
+                container_layout.addWidget(widget)
+
+            # Seed the per-column config cache; from here on the rows
+            # patch their own entries via _on_line_style_changed. The row
+            # set changed, so the whole-config cache goes too.
+            self._line_config_cache = {
+                col: w.get_config() for col, w in self.line_widgets.items()}
+            self._config_cache = None
+
+            # Rows dropped this round go to a bounded pool in case their
+            # column comes back; only pool evictions are destroyed. The
+            # setParent(None) detach keeps them out of the old
+            # container's deleteLater below.
+            for column, widget in reusable.items():
+                widget.setParent(None)
+                self._widget_pool[column] = widget
+            while len(self._widget_pool) > 32:
+                self._widget_pool.pop(next(iter(self._widget_pool))).deleteLater()
+
+            old_container = self.lines_container
+            self.lines_layout.replaceWidget(old_container, container)
+            old_container.deleteLater()
+            self.lines_container = container
+            self.lines_container_layout = container_layout
+        finally:
+            self.setUpdatesEnabled(True)
             
     def apply_comprehensive_style(self, style_name: str):
         """Apply a comprehensive professional style."""
-        from assets.comprehensive_styles import get_style
-        
+        # Re-applying the already-active style cannot change anything;
+        # skip the whole control batch and emission.
+        if style_name == self._current_style:
+            return
         try:
             style = get_style(style_name)
-            
-            # Apply colors
-            self.bg_color_button.update_color(style['background_color'])
-            self.grid_color_button.update_color(style['grid_color'])
-            
-            # Apply font settings
-            if 'font_family' in style:
-                index = self.font_family_combo.findText(style['font_family'])
+
+            # Legend controls are written below.
+            self._ensure_tab(self._LEGEND_TAB)
+
+            # Block each control's change signal while values are written:
+            # the per-control slots have nothing useful to do mid-batch,
+            # and the single _schedule_emit below covers the whole change.
+            # setUpdatesEnabled folds the repaints into one pass too.
+            self.setUpdatesEnabled(False)
+            try:
+                blockers = [QSignalBlocker(w) for w in (
+                    self.font_family_combo, self.font_size_spin,
+                    self.title_size_spin, self.show_grid_check,
+                    self.grid_type_combo, self.legend_position_combo,
+                    self.legend_ncol_spin, self.legend_alpha_spin)]
+
+                # Apply colors
+                self.bg_color_button.update_color(style.background_color)
+                self.grid_color_button.update_color(style.grid_color)
+
+                # Apply font settings
+                index = self.font_family_combo.findText(style.font_family)
                 if index >= 0:
                     self.font_family_combo.setCurrentIndex(index)
-            
-            if 'font_size' in style:
-                self.font_size_spin.setValue(style['font_size'])
-            
-            if 'title_fontsize' in style:
-                self.title_size_spin.setValue(style['title_fontsize'])
-            
-            # Apply grid settings
-            if 'show_grid' in style:
-                self.show_grid_check.setChecked(style.get('show_grid', True))
-            
-            if 'grid_type' in style:
-                index = self.grid_type_combo.findData(style['grid_type'])
+
+                self.font_size_spin.setValue(style.font_size)
+                self.title_size_spin.setValue(style.title_fontsize)
+
+                # Apply grid settings
+                self.show_grid_check.setChecked(style.grid_type is not GridType.NONE)
+
+                index = self.grid_type_combo.findData(style.grid_type.as_str)
                 if index >= 0:
                     self.grid_type_combo.setCurrentIndex(index)
-            
-            # Apply legend settings
-            if 'legend_position' in style:
-                index = self.legend_position_combo.findText(style['legend_position'])
+
+                # Apply legend settings
+                index = self.legend_position_combo.findText(style.legend_position)
                 if index >= 0:
                     self.legend_position_combo.setCurrentIndex(index)
-            
-            if 'legend_ncol' in style:
-                self.legend_ncol_spin.setValue(style['legend_ncol'])
-            
-            if 'legend_framealpha' in style:
-                self.legend_alpha_spin.setValue(style['legend_framealpha'])
-            
-            # Update line colors
-            for i, (column, widget) in enumerate(self.line_widgets.items()):
-                color = style['line_colors'][i % len(style['line_colors'])]
-                widget.set_color(color)
-            
-            self.style_changed.emit()
+
+                self.legend_ncol_spin.setValue(style.legend_ncol)
+                self.legend_alpha_spin.setValue(style.legend_framealpha)
+
+                # Update line colors
+                for i, (column, widget) in enumerate(self.line_widgets.items()):
+                    color = style.line_colors[i % len(style.line_colors)]
+                    widget.set_color(color)
+
+                del blockers
+            finally:
+                self.setUpdatesEnabled(True)
+
+            self._current_style = style_name
+            self._schedule_emit()
         except Exception as e:
             pass  # Ignore errors
     
     def get_special_preset_config(self) -> dict:
         """Get period highlights from selected special preset."""
         preset_name = self.special_preset_combo.currentText()
-        if preset_name == "None":
+        if preset_name == "None" or get_special_preset is None:
             return {'period_highlights': []}
-        
+
         try:
-            from assets.themes import get_special_preset
             preset = get_special_preset(preset_name)
             return {'period_highlights': preset.get('period_highlights', [])}
         except Exception:
             return {'period_highlights': []}
             
+    def _on_line_style_changed(self, column: str):
+        """Refresh one row's cached config, then forward the change."""
+        widget = self.line_widgets.get(column)
+        if widget is not None:
+            self._line_config_cache[column] = widget.get_config()
+        self._schedule_emit()
+
     def get_config(self) -> dict:
         """Get current style configuration."""
-        line_configs = [widget.get_config() for widget in self.line_widgets.values()]
-        
-        return {
+        cfg = self._config_cache
+        if cfg is not None:
+            return cfg
+        self._ensure_all_tabs()
+        line_configs = list(self._line_config_cache.values())
+
+        cfg = self._config_cache = {
             'background_color': self.bg_color_button.get_color(),
             'grid_color': self.grid_color_button.get_color(),
             'font_family': self.font_family_combo.currentText(),
@@ -485,5 +660,10 @@ class StylePanel(QWidget):
             'legend_labelspacing': self.legend_labelspacing_spin.value(),
             'legend_handlelength': self.legend_handlelength_spin.value(),
             'legend_handletextpad': self.legend_handletextpad_spin.value(),
-            'line_configs': line_configs
+            'line_configs': line_configs,
+            # Precomputed here so config consumers need not rescan the
+            # line list per rebuild.
+            'has_secondary_lines': any(
+                lc['use_secondary_axis'] for lc in line_configs)
         }
+        return cfg
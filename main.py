@@ -13,6 +13,7 @@ Author: BERC
 Version: 1.0.0
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -38,8 +39,17 @@ def main():
     app.setApplicationName("Excel Chart Generator")
     app.setOrganizationName("BERC")
     
-    # Set application style
-    app.setStyle("Fusion")
+    # Forcing a QStyle is a slow operation and discards the native look
+    # Qt already optimizes for the platform, so only honor an explicit
+    # request (e.g. BERC_STYLE=Fusion).
+    style_name = os.environ.get("BERC_STYLE")
+    if style_name:
+        app.setStyle(style_name)
+
+    # Constant widget rules live in one application-level sheet, parsed
+    # once; per-instance sheets (ColorButton backgrounds) then carry
+    # only what actually varies.
+    app.setStyleSheet("ColorButton { border: 1px solid #888; }")
     
     # Create and show main window
     window = MainWindow()
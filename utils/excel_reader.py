@@ -4,6 +4,26 @@ import pandas as pd
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 
+# calamine (a Rust spreadsheet parser) reads .xlsx several times faster
+# than openpyxl and with far less memory; use it when python-calamine is
+# installed, otherwise stay on pandas' default engine.
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+
+def _preferred_engine(suffix: str) -> Optional[str]:
+    """Pick the fastest available pandas engine for a file extension."""
+    if suffix in ('.xlsx', '.xlsm'):
+        return 'calamine' if _HAS_CALAMINE else None
+    if suffix == '.xlsb':
+        return 'pyxlsb'
+    if suffix == '.xls':
+        return 'xlrd'
+    return None
+
 
 class ExcelReader:
     """Handles Excel file loading and data extraction."""
@@ -17,8 +37,19 @@ class ExcelReader:
         """
         self.file_path = file_path
         self.excel_file: Optional[pd.ExcelFile] = None
+        # (resolved path, mtime_ns, size) of the open workbook; lets
+        # redundant load_file calls skip re-parsing the zip directory.
+        self._file_meta = None
+        self._sheet_names: Optional[List[str]] = None
         self.current_sheet: Optional[str] = None
         self.dataframe: Optional[pd.DataFrame] = None
+        self._dtypes: Optional[pd.Series] = None
+        self._columns: Optional[List[str]] = None
+        self._column_set: Optional[frozenset] = None
+        self._numeric_columns: Optional[List[str]] = None
+        # Parsed sheets, keyed by name; parsing dominates multi-MB
+        # workbooks, so reselecting a sheet becomes a dict lookup.
+        self._sheet_cache: Dict[str, pd.DataFrame] = {}
         
     def load_file(self, file_path: str) -> List[str]:
         """
@@ -39,15 +70,37 @@ class ExcelReader:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        if path.suffix.lower() not in ['.xlsx', '.xls', '.xlsm']:
-            raise ValueError(f"Invalid file format: {path.suffix}. Expected .xlsx, .xls, or .xlsm")
-        
-        try:
-            self.file_path = file_path
-            self.excel_file = pd.ExcelFile(file_path)
-            return self.excel_file.sheet_names
-        except Exception as e:
-            raise ValueError(f"Failed to load Excel file: {str(e)}")
+        suffix = path.suffix.lower()
+        if suffix not in ['.xlsx', '.xls', '.xlsm', '.xlsb']:
+            raise ValueError(f"Invalid file format: {path.suffix}. Expected .xlsx, .xls, .xlsm, or .xlsb")
+
+        # Same file, unchanged on disk, already open: nothing to redo.
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key == self._file_meta and self.excel_file is not None:
+            return self._sheet_names
+
+        # Engine fallback chain: preferred engine for the extension
+        # (calamine / pyxlsb / xlrd), then pandas' default if the
+        # preferred one is missing or rejects the file.
+        self.file_path = file_path
+        self._file_meta = None
+        self.excel_file = None
+        self._sheet_cache.clear()
+        engine = _preferred_engine(suffix)
+        if engine is not None:
+            try:
+                self.excel_file = pd.ExcelFile(file_path, engine=engine)
+            except Exception:
+                self.excel_file = None
+        if self.excel_file is None:
+            try:
+                self.excel_file = pd.ExcelFile(file_path)
+            except Exception as e:
+                raise ValueError(f"Failed to load Excel file: {str(e)}")
+        self._file_meta = key
+        self._sheet_names = self.excel_file.sheet_names
+        return self._sheet_names
     
     def load_sheet(self, sheet_name: str) -> pd.DataFrame:
         """
@@ -67,18 +120,112 @@ class ExcelReader:
         
         if sheet_name not in self.excel_file.sheet_names:
             raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
-        
-        try:
+
+        cached = self._sheet_cache.get(sheet_name)
+        if cached is not None:
             self.current_sheet = sheet_name
-            self.dataframe = pd.read_excel(self.excel_file, sheet_name=sheet_name)
-            
+            self.dataframe = cached
+            self._index_columns(cached)
+            return cached
+
+        try:
+            df = pd.read_excel(self.excel_file, sheet_name=sheet_name)
+
             # Clean column names - remove leading/trailing whitespace
-            self.dataframe.columns = self.dataframe.columns.str.strip()
-            
+            df.columns = df.columns.str.strip()
+
+            # Downcast numeric columns to the smallest dtype that holds
+            # them (int64/float64 -> int8..int32/float32 where possible);
+            # done once per load, it halves memory and the bytes every
+            # downstream plot pass touches.
+            for col in df.select_dtypes(include=['integer']).columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            for col in df.select_dtypes(include=['float']).columns:
+                df[col] = pd.to_numeric(df[col], downcast='float')
+
+            # Publish only once the read succeeded, so current_sheet and
+            # dataframe never disagree about which sheet is loaded.
+            self.current_sheet = sheet_name
+            self.dataframe = df
+            self._index_columns(df)
+
+            # Keep the handful of most recently parsed sheets (dicts
+            # iterate in insertion order, so the first key is oldest).
+            if len(self._sheet_cache) >= 8:
+                self._sheet_cache.pop(next(iter(self._sheet_cache)))
+            self._sheet_cache[sheet_name] = df
+
             return self.dataframe
         except Exception as e:
             raise ValueError(f"Failed to load sheet '{sheet_name}': {str(e)}")
-    
+
+    def _index_columns(self, df: pd.DataFrame):
+        """Memoize column metadata the GUI reads on every callback."""
+        self._dtypes = df.dtypes
+        self._columns = df.columns.tolist()
+        self._column_set = frozenset(self._columns)
+        self._numeric_columns = [
+            col for col, dtype in self._dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)]
+
+
+    def load_sheet_preview(self, sheet_name: str, nrows: int = 5) -> pd.DataFrame:
+        """
+        Read only the header and first few rows of a sheet.
+
+        Uses openpyxl's streaming read-only mode, so the cost is
+        proportional to the rows actually read rather than the sheet size.
+        Unlike load_sheet, this does not set the current sheet or dataframe.
+
+        Args:
+            sheet_name: Name of the sheet to preview
+            nrows: Number of data rows to read after the header
+
+        Returns:
+            DataFrame containing the first nrows rows of the sheet
+
+        Raises:
+            ValueError: If no file is loaded or sheet doesn't exist
+        """
+        if self.excel_file is None:
+            raise ValueError("No Excel file loaded. Call load_file() first.")
+
+        if sheet_name not in self.excel_file.sheet_names:
+            raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
+
+        # Only .xlsx/.xlsm are openpyxl's formats; handing it .xls or
+        # .xlsb raises InvalidFileException, so don't even try.
+        try:
+            if Path(self.file_path).suffix.lower() in ('.xlsx', '.xlsm'):
+                import openpyxl
+
+                workbook = openpyxl.load_workbook(
+                    self.file_path, read_only=True, data_only=True)
+                try:
+                    rows = workbook[sheet_name].iter_rows(
+                        max_row=nrows + 1, values_only=True)
+                    header = next(rows, None)
+                    if header is None:
+                        return pd.DataFrame()
+                    columns = [str(c).strip() if c is not None else ''
+                               for c in header]
+                    preview = pd.DataFrame(list(rows), columns=columns)
+                    # Let numeric columns read as object (streamed cells
+                    # are untyped Python values) coerce for dtype-based
+                    # defaults
+                    return preview.infer_objects()
+                finally:
+                    workbook.close()
+        except (ImportError, KeyError, OSError):
+            pass
+
+        # Formats openpyxl cannot stream (.xls, .xlsb), or streaming
+        # failed: trimmed pandas read
+        preview = pd.read_excel(
+            self.excel_file, sheet_name=sheet_name, nrows=nrows)
+        preview.columns = preview.columns.str.strip()
+        return preview
+
     def get_columns(self) -> List[str]:
         """
         Get list of column names from the current sheet.
@@ -91,7 +238,9 @@ class ExcelReader:
         """
         if self.dataframe is None:
             raise ValueError("No sheet loaded. Call load_sheet() first.")
-        
+
+        if self._columns is not None:
+            return self._columns
         return self.dataframe.columns.tolist()
     
     def get_numeric_columns(self) -> List[str]:
@@ -106,9 +255,13 @@ class ExcelReader:
         """
         if self.dataframe is None:
             raise ValueError("No sheet loaded. Call load_sheet() first.")
-        
-        numeric_columns = self.dataframe.select_dtypes(include=['number']).columns.tolist()
-        return numeric_columns
+
+        # Read from the list cached at load time instead of re-scanning
+        # the frame.
+        if self._numeric_columns is not None:
+            return self._numeric_columns
+        return [col for col, dtype in self.dataframe.dtypes.items()
+                if pd.api.types.is_numeric_dtype(dtype)]
     
     def get_column_data(self, column_name: str) -> pd.Series:
         """
@@ -188,29 +341,39 @@ class ExcelReader:
         if self.dataframe is None:
             raise ValueError("No sheet loaded. Call load_sheet() first.")
         
-        # Validate columns exist
+        # Validate columns exist (against the cached frozenset: O(1) per
+        # column instead of an Index scan)
         all_columns = [x_column] + y_columns
-        missing = [col for col in all_columns if col not in self.dataframe.columns]
+        column_set = (self._column_set if self._column_set is not None
+                      else frozenset(self.dataframe.columns))
+        missing = [col for col in all_columns if col not in column_set]
         if missing:
             raise ValueError(f"Columns not found: {', '.join(missing)}")
-        
-        # Extract data
-        data = {'x': self.dataframe[x_column].copy()}
-        
-        for y_col in y_columns:
-            data[y_col] = self.dataframe[y_col].copy()
-        
-        # Remove rows with NaN values in selected columns
-        mask = pd.notna(data['x'])
+
+        # Drop NaN rows across all selected columns in one pass: pandas
+        # computes the combined mask in C, instead of a Python chain of
+        # per-column notna masks over explicitly copied Series. The
+        # dropna result is already a fresh frame, so no .copy() needed.
+        cols = list(dict.fromkeys(all_columns))
+        sub = self.dataframe.loc[:, cols].dropna(how='any')
+        sub = sub.reset_index(drop=True)
+
+        data = {'x': sub[x_column]}
         for y_col in y_columns:
-            mask &= pd.notna(data[y_col])
-        
-        return {key: series[mask].reset_index(drop=True) for key, series in data.items()}
+            data[y_col] = sub[y_col]
+        return data
     
     def close(self):
         """Close the Excel file and clean up resources."""
         if self.excel_file is not None:
             self.excel_file.close()
             self.excel_file = None
+        self._file_meta = None
+        self._sheet_names = None
         self.dataframe = None
         self.current_sheet = None
+        self._dtypes = None
+        self._columns = None
+        self._column_set = None
+        self._numeric_columns = None
+        self._sheet_cache.clear()